@@ -9,6 +9,12 @@ from typing import Any
 import nbformat
 import yaml
 
+try:
+    # libyaml-backed loader; same safety guarantees as SafeLoader, much faster.
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 _FRONT_MATTER_RE = re.compile(r"\A---[ \t]*\n(.*?)\n---[ \t]*\n", re.DOTALL)
 
 
@@ -18,7 +24,7 @@ def split_front_matter(text: str) -> tuple[dict[str, Any], str]:
     if not match:
         return {}, text
     try:
-        front_matter = yaml.safe_load(match.group(1)) or {}
+        front_matter = yaml.load(match.group(1), Loader=_YamlLoader) or {}
     except yaml.YAMLError:
         front_matter = {}
     return front_matter, text[match.end():]
@@ -1,12 +1,12 @@
 """Programmatic API for server-side nb2wb usage."""
 from __future__ import annotations
 
-from copy import deepcopy
-import re
+import functools
+import stat
 from collections.abc import Mapping
 from pathlib import Path
+from secrets import token_hex
 from typing import Any
-from uuid import uuid4
 
 import nbformat
 
@@ -14,8 +14,11 @@ from .config import Config, apply_platform_defaults, load_config, load_config_fr
 from .converter import Converter
 from .platforms import get_builder, list_platforms
 
-_CONTROL_CHAR_RE = re.compile(r"[\x00-\x1f\x7f]")
+# C0 control characters plus DEL; membership via frozenset.isdisjoint is a
+# tight C loop, cheaper than a regex search on short path strings.
+_CONTROL_CHARS = frozenset(map(chr, [*range(0x20), 0x7F]))
 _ALLOWED_INPUT_SUFFIXES = frozenset({".ipynb", ".qmd", ".md"})
+_ALLOWED_SUFFIX_MSG = ", ".join(sorted(_ALLOWED_INPUT_SUFFIXES))
 
 
 def convert(
@@ -25,6 +28,7 @@ def convert(
     target: str = "substack",
     execute: bool = False,
     working_dir: str | Path | None = None,
+    validate: bool = True,
 ) -> str:
     """Convert an input notebook/document into platform-ready HTML.
 
@@ -41,20 +45,26 @@ def convert(
         execute: Whether to execute code cells before rendering.
         working_dir: Execution working directory for in-memory notebook payloads.
             Defaults to current working directory. Ignored for path inputs.
+        validate: Whether to validate ``.ipynb`` files and in-memory notebook
+            payloads against the nbformat schema. Only disable this for
+            notebooks produced by trusted code; untrusted input must stay
+            validated.
 
     Returns:
         Full HTML page ready for the selected target.
     """
-    resolved_config = _resolve_config(config)
-    resolved_config = apply_platform_defaults(resolved_config, target)
+    if config is None:
+        resolved_config = _default_target_config(target)
+    else:
+        resolved_config = apply_platform_defaults(_resolve_config(config), target)
     builder = get_builder(target)
     converter = Converter(resolved_config, execute=execute)
 
     if isinstance(notebook, (str, Path)):
         notebook_path = _sanitize_input_path(notebook)
-        content_html = converter.convert(notebook_path)
+        content_html = converter.convert(notebook_path, validate=validate)
     else:
-        notebook_node = _coerce_notebook_node(notebook)
+        notebook_node = _coerce_notebook_node(notebook, validate=validate)
         content_html = converter.convert_notebook(
             notebook_node,
             cwd=_resolve_working_dir(working_dir),
@@ -67,6 +77,16 @@ def supported_targets() -> list[str]:
     return list_platforms()
 
 
+@functools.lru_cache(maxsize=16)
+def _default_target_config(target: str) -> Config:
+    """Return the platform-adjusted default config for *target*, built once.
+
+    The cached instance is only handed to the converter, which never mutates
+    it, so sharing it across calls is safe without freezing ``Config``.
+    """
+    return apply_platform_defaults(Config(), target)
+
+
 def _resolve_config(
     config: Config | Mapping[str, Any] | str | Path | None,
 ) -> Config:
@@ -85,14 +105,13 @@ def _resolve_config(
 
 def _sanitize_input_path(path_like: str | Path) -> Path:
     raw = str(path_like)
-    if _CONTROL_CHAR_RE.search(raw):
+    if not _CONTROL_CHARS.isdisjoint(raw):
         raise ValueError("notebook path contains invalid control characters")
 
     path = Path(path_like)
-    suffix = path.suffix.lower()
-    if suffix not in _ALLOWED_INPUT_SUFFIXES:
-        allowed = ", ".join(sorted(_ALLOWED_INPUT_SUFFIXES))
-        raise ValueError(f"notebook path must use one of: {allowed}")
+    suffix = path.suffix
+    if suffix not in _ALLOWED_INPUT_SUFFIXES and suffix.lower() not in _ALLOWED_INPUT_SUFFIXES:
+        raise ValueError(f"notebook path must use one of: {_ALLOWED_SUFFIX_MSG}")
     if not path.exists():
         raise FileNotFoundError(f"'{path}' not found.")
     return path
@@ -100,12 +119,17 @@ def _sanitize_input_path(path_like: str | Path) -> Path:
 
 def _coerce_notebook_node(
     notebook: Mapping[str, Any] | nbformat.NotebookNode,
+    *,
+    validate: bool = True,
 ) -> nbformat.NotebookNode:
-    """Normalize and validate an in-memory notebook payload."""
+    """Normalize and (unless *validate* is false) validate an in-memory notebook payload."""
+    # ``from_dict`` rebuilds every dict/list container, so the normalization
+    # below never mutates the caller's payload; leaf values are immutable and
+    # shared rather than deep-copied.
     if isinstance(notebook, nbformat.NotebookNode):
-        node = deepcopy(notebook)
+        node = nbformat.from_dict(notebook)
     elif isinstance(notebook, Mapping):
-        node = nbformat.from_dict(deepcopy(dict(notebook)))
+        node = nbformat.from_dict(dict(notebook))
     else:
         raise TypeError(
             "notebook must be a path or an in-memory Jupyter notebook "
@@ -117,9 +141,14 @@ def _coerce_notebook_node(
     # - add kernelspec.display_name when kernelspec.name exists
     cells = node.get("cells", [])
     if isinstance(cells, list):
-        for cell in cells:
-            if isinstance(cell, Mapping) and not cell.get("id"):
-                cell["id"] = uuid4().hex[:8]
+        missing = [
+            cell for cell in cells if isinstance(cell, Mapping) and not cell.get("id")
+        ]
+        if missing:
+            # One RNG read for all missing ids: 8 hex chars per cell.
+            blob = token_hex(4 * len(missing))
+            for i, cell in enumerate(missing):
+                cell["id"] = blob[i * 8:(i + 1) * 8]
 
     metadata = node.get("metadata", {})
     if isinstance(metadata, Mapping):
@@ -129,6 +158,10 @@ def _coerce_notebook_node(
             if name and not kernelspec.get("display_name"):
                 kernelspec["display_name"] = str(name)
 
+    if not validate:
+        # Trusted payload: skip the full JSON-schema walk over every cell/output.
+        return node
+
     try:
         nbformat.validate(node)
     except Exception as exc:
@@ -142,12 +175,15 @@ def _resolve_working_dir(path_like: str | Path | None) -> Path:
         return Path.cwd()
 
     raw = str(path_like)
-    if _CONTROL_CHAR_RE.search(raw):
+    if not _CONTROL_CHARS.isdisjoint(raw):
         raise ValueError("working_dir contains invalid control characters")
 
     path = Path(path_like)
-    if not path.exists():
-        raise FileNotFoundError(f"working_dir '{path}' not found.")
-    if not path.is_dir():
+    # One stat call answers both "exists?" and "is it a directory?".
+    try:
+        st = path.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        raise FileNotFoundError(f"working_dir '{path}' not found.") from None
+    if not stat.S_ISDIR(st.st_mode):
         raise ValueError(f"working_dir '{path}' must be a directory.")
     return path.resolve()
@@ -1,81 +1,124 @@
 import argparse
 import base64
 import binascii
-import functools
-import json
 import re
-import socket
-import subprocess
 import sys
-import time
-import webbrowser
-from http.server import HTTPServer, SimpleHTTPRequestHandler
 from pathlib import Path
 
 from .api import convert as convert_notebook
 from .platforms import list_platforms, MIME_TO_EXT
 
-_CONTROL_CHAR_RE = re.compile(r"[\x00-\x1f\x7f]")
+_CONTROL_CHARS = frozenset(map(chr, [*range(0x20), 0x7F]))
 _ALLOWED_INPUT_SUFFIXES = frozenset({".ipynb", ".qmd", ".md"})
+_DATA_URI_RE = re.compile(
+    r'<img\s+[^>]*src="(data:([^;]+);base64,([^"]+))"[^>]*/?>',
+    re.IGNORECASE,
+)
+_MAX_WRITE_WORKERS = 8
+_NGROK_POLL_INITIAL_DELAY = 0.05
+_NGROK_POLL_MAX_DELAY = 1.0
 
 
 def _extract_images(html: str, images_dir: Path) -> str:
     """Replace data-URI ``<img>`` sources with files in *images_dir*.
 
-    Creates *images_dir* if needed, writes each image as a file, and returns
-    the HTML with ``src`` attributes rewritten to relative paths
-    (e.g. ``images/img_1.png``).
+    Creates *images_dir* on the first data-URI match, writes each image as
+    a file, and returns the HTML with ``src`` attributes rewritten to
+    relative paths (e.g. ``images/img_1.png``).
     """
-    images_dir.mkdir(parents=True, exist_ok=True)
-    counter = 0
-
-    data_uri_re = re.compile(
-        r'<img\s+[^>]*src="(data:([^;]+);base64,([^"]+))"[^>]*/?>',
-        re.IGNORECASE,
-    )
+    if "base64," not in html:
+        return html  # no inline payloads: skip the regex sweep entirely
 
-    def _replace(m: re.Match) -> str:
-        nonlocal counter
-        counter += 1
-        full_tag = m.group(0)
-        full_uri = m.group(1)
+    counter = 0
+    parts: list[str] = []
+    pending: list[tuple[Path, bytes]] = []
+    pos = 0
+    dir_ready = False
+
+    for m in _DATA_URI_RE.finditer(html):
+        if not dir_ready:
+            images_dir.mkdir(parents=True, exist_ok=True)
+            dir_ready = True
         mime = m.group(2)
-        b64 = m.group(3)
-
         if mime not in MIME_TO_EXT:
-            return full_tag  # skip non-image MIME types
-
-        ext = MIME_TO_EXT[mime]
-        filename = f"img_{counter}{ext}"
-        filepath = images_dir / filename
+            continue  # skip non-image MIME types
 
         try:
-            filepath.write_bytes(base64.b64decode(b64, validate=True))
+            data = base64.b64decode(m.group(3), validate=True)
         except (binascii.Error, ValueError):
             # Malformed payload: keep the original tag unchanged.
-            counter -= 1
-            return full_tag
+            continue
+
+        counter += 1
+        filename = f"img_{counter}{MIME_TO_EXT[mime]}"
+        pending.append((images_dir / filename, data))
+
+        # Splice the new path over the src value span; the rest of the tag
+        # is copied through untouched.
+        parts.append(html[pos:m.start(1)])
+        parts.append(f"images/{filename}")
+        pos = m.end(1)
+
+    parts.append(html[pos:])
+    _write_files(pending)
+    return "".join(parts)
+
+
+def _write_files(files: list[tuple[Path, bytes]]) -> None:
+    """Write ``(path, data)`` pairs to disk, overlapping the writes on a thread pool."""
+    if len(files) < 2:
+        for path, data in files:
+            path.write_bytes(data)
+        return
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(_MAX_WRITE_WORKERS, len(files))) as pool:
+        # Consume the iterator so write errors propagate to the caller.
+        list(pool.map(lambda item: item[0].write_bytes(item[1]), files))
+
+
+def _sendfile_request_handler() -> type:
+    """Return a static-file request handler that streams bodies with ``sendfile``.
 
-        rel_path = f"images/{filename}"
-        return full_tag.replace(f'src="{full_uri}"', f'src="{rel_path}"')
+    ``socket.sendfile`` uses the kernel's zero-copy path where available and
+    falls back to a plain read/send loop elsewhere.
+    """
+    from http.server import SimpleHTTPRequestHandler
+
+    class _SendfileRequestHandler(SimpleHTTPRequestHandler):
+        def copyfile(self, source, outputfile) -> None:
+            self.wfile.flush()
+            self.connection.sendfile(source)
 
-    return data_uri_re.sub(_replace, html)
+    return _SendfileRequestHandler
 
 
 def _find_free_port() -> int:
     """Return a free TCP port on localhost."""
+    import socket
+
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
         s.bind(("127.0.0.1", 0))
         return s.getsockname()[1]
 
 
-def _get_ngrok_url(max_attempts: int = 10) -> str:
-    """Poll ngrok's local API until the public tunnel URL is available."""
+def _get_ngrok_url(max_attempts: int = 15) -> str:
+    """Poll ngrok's local API until the public tunnel URL is available.
+
+    Polls immediately, then backs off exponentially from 50 ms up to 1 s
+    between attempts (about 10.5 s of waiting in total by default).
+    """
+    import json
+    import time
     import urllib.error
     import urllib.request
 
-    for _ in range(max_attempts):
-        time.sleep(1)
+    delay = _NGROK_POLL_INITIAL_DELAY
+    for attempt in range(max_attempts):
+        if attempt:
+            time.sleep(delay)
+            delay = min(delay * 2, _NGROK_POLL_MAX_DELAY)
         try:
             with urllib.request.urlopen("http://127.0.0.1:4040/api/tunnels", timeout=2) as resp:
                 data = json.loads(resp.read())
@@ -91,8 +134,16 @@ def _get_ngrok_url(max_attempts: int = 10) -> str:
 
 def _serve(serve_dir: Path, html_name: str) -> None:
     """Extract images, start HTTP server + ngrok tunnel, open browser."""
+    # Serve-only modules are imported here to keep CLI start-up lean for
+    # the common convert-and-write path.
+    import functools
+    import subprocess
+    import threading
+    import webbrowser
+    from http.server import HTTPServer
+
     port = _find_free_port()
-    handler = functools.partial(SimpleHTTPRequestHandler, directory=str(serve_dir))
+    handler = functools.partial(_sendfile_request_handler(), directory=str(serve_dir))
     server = HTTPServer(("127.0.0.1", port), handler)
 
     # Start ngrok
@@ -125,8 +176,6 @@ def _serve(serve_dir: Path, html_name: str) -> None:
     webbrowser.open(page_url)
 
     # Serve until interrupted
-    import threading
-
     server_thread = threading.Thread(target=server.serve_forever, daemon=True)
     server_thread.start()
 
@@ -182,6 +231,13 @@ def main() -> None:
         action="store_true",
         help="Execute code blocks via Jupyter kernel before rendering (.ipynb, .qmd, .md).",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=_positive_int,
+        default=None,
+        help="Worker processes for cell rendering (overrides 'jobs' in the config; default: 1)",
+    )
 
     args = parser.parse_args()
 
@@ -203,9 +259,16 @@ def main() -> None:
 
     print(f"Converting '{notebook_path}' for {args.target} …")
     try:
+        config = config_path
+        if args.jobs is not None:
+            from dataclasses import replace
+
+            from .config import load_config
+
+            config = replace(load_config(config_path), jobs=args.jobs)
         html = convert_notebook(
             notebook_path,
-            config=config_path,
+            config=config,
             target=args.target,
             execute=args.execute,
         )
@@ -223,9 +286,22 @@ def main() -> None:
     if args.serve:
         _serve(output_path.parent, output_path.name)
     elif args.open:
+        import webbrowser
+
         webbrowser.open(output_path.absolute().as_uri())
 
 
+def _positive_int(value: str) -> int:
+    """argparse type for options that take a count of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got '{value}'") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got '{value}'")
+    return number
+
+
 def _sanitize_cli_path(
     path: Path | None,
     *,
@@ -238,12 +314,12 @@ def _sanitize_cli_path(
         return None
 
     raw = str(path)
-    if _CONTROL_CHAR_RE.search(raw):
+    if not _CONTROL_CHARS.isdisjoint(raw):
         raise ValueError(f"{arg_name} contains invalid control characters")
 
     if allowed_suffixes is not None:
-        suffix = path.suffix.lower()
-        if suffix not in allowed_suffixes:
+        suffix = path.suffix
+        if suffix not in allowed_suffixes and suffix.lower() not in allowed_suffixes:
             allowed = ", ".join(sorted(allowed_suffixes))
             raise ValueError(
                 f"{arg_name} must use one of: {allowed}"
@@ -1,12 +1,19 @@
 from __future__ import annotations
 
+import functools
 import yaml
 from collections.abc import Mapping
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Any
 from typing import Optional
 
+try:
+    # libyaml-backed loader; same safety guarantees as SafeLoader, much faster.
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 
 @dataclass
 class CodeConfig:
@@ -57,11 +64,18 @@ class Config:
 
     image_width: int = 1920  # default canvas width for all rendered images
     border_radius: int = 14  # corner radius in pixels for all rendered images
+    jobs: int = 1  # worker processes for cell rendering (1 = render in-process)
     code: CodeConfig = field(default_factory=CodeConfig)
     latex: LatexConfig = field(default_factory=LatexConfig)
     safety: SafetyConfig = field(default_factory=SafetyConfig)
 
 
+# Accepted keys for each config section, used to filter user mappings.
+_CODE_FIELDS = frozenset(CodeConfig.__dataclass_fields__)
+_LATEX_FIELDS = frozenset(LatexConfig.__dataclass_fields__)
+_SAFETY_FIELDS = frozenset(SafetyConfig.__dataclass_fields__)
+
+
 def load_config_from_dict(data: Mapping[str, Any] | None) -> Config:
     """Load config from an in-memory mapping using the same schema as YAML config files."""
     if data is None:
@@ -79,38 +93,71 @@ def load_config(path: Optional[Path]) -> Config:
 
     Sub-configs (code, latex) inherit the top-level ``image_width`` and
     ``border_radius`` unless explicitly overridden in the YAML.
+
+    Parsed YAML is cached per file and reused until the file's mtime or size
+    changes; every call still returns a fresh ``Config`` instance.
     """
-    if path is None or not path.exists():
+    if path is None:
+        return Config()
+    try:
+        st = path.stat()
+    except (FileNotFoundError, NotADirectoryError):
         return Config()
 
+    data = _load_config_mapping(str(path.absolute()), st.st_mtime_ns, st.st_size)
+    return _build_config_from_mapping(data)
+
+
+@functools.lru_cache(maxsize=64)
+def _load_config_mapping(path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Parse a YAML config file; cached on ``(path, mtime_ns, size)``."""
     with open(path, "r") as f:
-        data = yaml.safe_load(f) or {}
+        data = yaml.load(f, Loader=_YamlLoader) or {}
 
     if not isinstance(data, dict):
         raise TypeError("Config YAML root must be a mapping/object.")
 
-    return _build_config_from_mapping(data)
+    return data
+
+
+def _coerce_jobs(value: Any) -> int:
+    """Validate the ``jobs`` setting, accepting ints and integer strings.
+
+    Booleans and non-integral floats are rejected rather than truncated, as
+    the CLI's ``--jobs`` would reject them.
+    """
+    if isinstance(value, bool) or (isinstance(value, float) and not value.is_integer()):
+        jobs = 0
+    else:
+        try:
+            jobs = int(value)
+        except (TypeError, ValueError):
+            jobs = 0
+    if jobs < 1:
+        raise ValueError(f"Config 'jobs': expected a positive integer, got '{value}'")
+    return jobs
 
 
 def _build_config_from_mapping(data: dict[str, Any]) -> Config:
     """Build Config from a parsed config mapping."""
     top_width = data.get("image_width", 1920)
     top_radius = data.get("border_radius", 0)
+    jobs = _coerce_jobs(data.get("jobs", 1))
 
     code_fields = {
         k: v
         for k, v in data.get("code", {}).items()
-        if k in CodeConfig.__dataclass_fields__
+        if k in _CODE_FIELDS
     }
     latex_fields = {
         k: v
         for k, v in data.get("latex", {}).items()
-        if k in LatexConfig.__dataclass_fields__
+        if k in _LATEX_FIELDS
     }
     safety_fields = {
         k: v
         for k, v in data.get("safety", {}).items()
-        if k in SafetyConfig.__dataclass_fields__
+        if k in _SAFETY_FIELDS
     }
 
     # Sub-configs inherit top-level image_width / border_radius unless overridden
@@ -122,6 +169,7 @@ def _build_config_from_mapping(data: dict[str, Any]) -> Config:
     return Config(
         image_width=top_width,
         border_radius=top_radius,
+        jobs=jobs,
         code=CodeConfig(**code_fields),
         latex=LatexConfig(**latex_fields),
         safety=SafetyConfig(**safety_fields),
@@ -154,21 +202,11 @@ def apply_platform_defaults(config: Config, platform: str) -> Config:
     if defaults is None:
         return config
 
-    code_overrides = defaults.get("code", {})
-    latex_overrides = defaults.get("latex", {})
-
-    # Build CodeConfig: start from current config, override with platform defaults
-    code_fields = {f: getattr(config.code, f) for f in CodeConfig.__dataclass_fields__}
-    code_fields.update(code_overrides)
-
-    # Build LatexConfig: start from current config, override with platform defaults
-    latex_fields = {f: getattr(config.latex, f) for f in LatexConfig.__dataclass_fields__}
-    latex_fields.update(latex_overrides)
-
-    return Config(
+    # Copy the config and its sub-configs, overriding only the fields the
+    # platform specifies; everything else (including safety) carries over.
+    return replace(
+        config,
         image_width=defaults.get("image_width", config.image_width),
-        border_radius=config.border_radius,
-        code=CodeConfig(**code_fields),
-        latex=LatexConfig(**latex_fields),
-        safety=config.safety,
+        code=replace(config.code, **defaults.get("code", {})),
+        latex=replace(config.latex, **defaults.get("latex", {})),
     )
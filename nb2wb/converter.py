@@ -20,16 +20,22 @@ Code cells
 """
 from __future__ import annotations
 
-import base64
+import os
 import re
 import warnings
+from binascii import b2a_base64
 from pathlib import Path
 from typing import Any
 
 import html as html_mod
 
-import markdown
 import nbformat
+from nbformat.reader import get_version, parse_json
+
+try:  # optional speed-up for large notebooks: ``pip install nb2wb[fast]``
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
 
 from .config import Config
 from .config import SafetyConfig
@@ -41,8 +47,10 @@ from .renderers.inline_latex import convert_inline_math
 from .renderers.latex_renderer import extract_display_math, render_latex_block
 from .sanitizer import sanitize_fragment
 
-# Strip ANSI colour codes from tracebacks
-_ANSI = re.compile(r"\x1b\[[0-9;]*[mGKFHJ]")
+# ANSI colour/cursor escapes in tracebacks: ESC [ <digits/;> <final char>
+_ANSI_PREFIX = "\x1b["
+_ANSI_PARAMS = "0123456789;"
+_ANSI_FINALS = frozenset("mGKFHJ")
 
 # Equation label / cross-reference patterns
 # (?<!\\) prevents matching when the backslash is itself escaped (\\label / \\eqref),
@@ -50,17 +58,20 @@ _ANSI = re.compile(r"\x1b\[[0-9;]*[mGKFHJ]")
 _LABEL_RE = re.compile(r"(?<!\\)\\label\{([^}]+)\}")
 _EQREF_RE = re.compile(r"(?<!\\)\\eqref\{([^}]+)\}")
 
-# Fenced code blocks — protected from all LaTeX processing
-# Matches ``` or ~~~  (3+ identical fence chars) with optional language tag
-_FENCED_CODE_RE = re.compile(r"^(`{3,})[^\n]*\n.*?\1[ \t]*$", re.MULTILINE | re.DOTALL)
+# Fenced code blocks (``` fences, found by _find_fenced_code_spans) and
+# inline code spans — protected from all LaTeX processing
 _INLINE_CODE_RE = re.compile(r"(`+)(.+?)\1")
 _PROTECTED_TOKEN = "\x00PROTECTED{}\x00"
+_PROTECTED_TOKEN_RE = re.compile(r"\x00PROTECTED(0|[1-9][0-9]*)\x00")
 
 # Markdown extensions used for cell conversion
 _MD_EXTENSIONS = ["extra", "sane_lists", "nl2br"]
 
 _RICH_OUTPUT_MIMES = frozenset({"image/png", "image/svg+xml", "text/html"})
 
+# Larger fragments are sanitized without caching to bound the per-document cache.
+_SANITIZE_CACHE_MAX_CHARS = 64 * 1024
+
 
 class Converter:
     """Converts a Jupyter notebook or Quarto document into HTML content fragments."""
@@ -68,15 +79,41 @@ class Converter:
     def __init__(self, config: Config, *, execute: bool = False) -> None:
         self.config = config
         self.execute = execute
+        self._md = None  # Markdown parser, built on the first markdown cell
+        self._reset_render_caches()
+
+    def _markdown_parser(self):
+        """Return this converter's Markdown parser, importing ``markdown`` lazily.
+
+        One parser per converter: extension setup runs once, and ``reset()``
+        clears per-document state (footnotes, abbreviations) between cells.
+        """
+        if self._md is None:
+            import markdown
+
+            self._md = markdown.Markdown(extensions=_MD_EXTENSIONS)
+        return self._md.reset()
+
+    def _reset_render_caches(self) -> None:
+        """Start fresh per-document caches of rendered images and fragments.
 
-    def convert(self, notebook_path: Path) -> str:
+        Notebooks often repeat the same source, output text, equation or
+        HTML fragment; identical inputs render identically under one config.
+        """
+        self._code_png_cache: dict[tuple[str, str], bytes] = {}
+        self._text_png_cache: dict[str, bytes] = {}
+        self._latex_uri_cache: dict[tuple[str, int | None], str] = {}
+        self._sanitize_cache: dict[tuple[str, str], str] = {}
+
+    def convert(self, notebook_path: Path, *, validate: bool = True) -> str:
         """Convert a ``.ipynb``, ``.qmd``, or ``.md`` file to a concatenated HTML string.
 
         Reads the notebook, collects LaTeX preamble and equation labels across
         all cells, then renders each markdown and code cell to HTML fragments.
+        ``validate=False`` skips the nbformat schema check for trusted ``.ipynb`` files.
         """
         _enforce_input_size(notebook_path, self.config.safety)
-        nb = _load_notebook(notebook_path, execute=self.execute)
+        nb = _load_notebook(notebook_path, execute=self.execute, validate=validate)
         return self._convert_loaded_notebook(nb)
 
     def convert_notebook(self, notebook, *, cwd: Path | None = None) -> str:
@@ -87,25 +124,59 @@ class Converter:
 
     def _convert_loaded_notebook(self, nb) -> str:
         """Render an already-loaded notebook node to concatenated HTML fragments."""
-        _enforce_notebook_limits(nb, self.config.safety)
+        display_math = _enforce_notebook_limits(nb, self.config.safety)
+        self._reset_render_caches()
+        # Tags are read once per cell and shared by every pass below.
+        cell_tags = [_cell_tags(cell) for cell in nb.cells]
         self._lang = _notebook_language(nb)
-        self._latex_preamble = _collect_latex_preamble(nb.cells)
-        self._eq_labels = _collect_equation_labels(nb.cells)
+        self._latex_preamble, self._eq_labels = _collect_doc_metadata(
+            nb.cells, display_math, cell_tags
+        )
 
-        parts: list[str] = []
-        for cell in nb.cells:
-            tags = _cell_tags(cell)
-            if _skip_cell(tags):
-                continue
-            if cell.cell_type == "markdown":
-                parts.append(self._markdown_cell(cell))
-            elif cell.cell_type == "code":
-                html = self._code_cell(cell, tags)
-                if html:
-                    parts.append(html)
-            # raw cells are skipped
+        visible: list[tuple[Any, frozenset[str]]] = [
+            (cell, tags) for cell, tags in zip(nb.cells, cell_tags) if not _skip_cell(tags)
+        ]
+
+        if self.config.jobs > 1 and len(visible) > 1:
+            rendered = self._render_cells_in_pool(visible)
+        else:
+            rendered = [self._render_cell(cell, tags) for cell, tags in visible]
+
+        return "\n".join(html for html in rendered if html)
+
+    def _render_cell(self, cell, tags: frozenset[str]) -> str:
+        """Render one visible cell to HTML; return ``""`` for cells without output."""
+        if cell.cell_type == "markdown":
+            return self._markdown_cell(cell)
+        if cell.cell_type == "code":
+            return self._code_cell(cell, tags)
+        return ""  # raw cells are skipped
 
-        return "\n".join(parts)
+    def _render_cells_in_pool(self, cells: list[tuple[Any, frozenset[str]]]) -> list[str]:
+        """Render cells on ``config.jobs`` worker processes, preserving order.
+
+        Cells are independent once the preamble and equation labels are known,
+        so each worker receives that document state once at start-up.
+        Warnings raised in workers are re-emitted here.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        state = (self.config, self._lang, self._latex_preamble, self._eq_labels)
+        # ``jobs`` is a request: never start more processes than CPUs or cells.
+        workers = min(self.config.jobs, os.cpu_count() or 1, len(cells))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_render_worker,
+            initargs=state,
+        ) as pool:
+            results = list(pool.map(_render_cell_in_worker, cells))
+
+        rendered: list[str] = []
+        for html, caught in results:
+            for message, category in caught:
+                warnings.warn(message, category, stacklevel=2)
+            rendered.append(html)
+        return rendered
 
     # ------------------------------------------------------------------
     # Cell processors
@@ -116,10 +187,11 @@ class Converter:
         src, stash = _protect_markdown_code_spans(cell.source)
 
         # 0. Substitute \eqref{label} → (N) throughout
-        def _eqref_sub(m: re.Match) -> str:
-            n = self._eq_labels.get(m.group(1))
-            return f"({n})" if n is not None else m.group(0)
-        src = _EQREF_RE.sub(_eqref_sub, src)
+        if "\\eqref" in src:
+            def _eqref_sub(m: re.Match) -> str:
+                n = self._eq_labels.get(m.group(1))
+                return f"({n})" if n is not None else m.group(0)
+            src = _EQREF_RE.sub(_eqref_sub, src)
 
         # 1. Replace display-math blocks with inline Markdown images
         blocks = extract_display_math(src)
@@ -129,12 +201,15 @@ class Converter:
             chunks.append(src[prev:start])
             try:
                 latex, tag_num = _apply_eq_tag(latex, self._eq_labels)
-                uri = render_latex_block(
-                    latex,
-                    self.config.latex,
-                    self._latex_preamble,
-                    tag=tag_num,
-                )
+                uri = self._latex_uri_cache.get((latex, tag_num))
+                if uri is None:
+                    uri = render_latex_block(
+                        latex,
+                        self.config.latex,
+                        self._latex_preamble,
+                        tag=tag_num,
+                    )
+                    self._latex_uri_cache[(latex, tag_num)] = uri
                 # Blank lines around the image so Markdown treats it as a block
                 chunks.append(f"\n\n![math]({uri})\n\n")
             except Exception as exc:
@@ -155,8 +230,8 @@ class Converter:
         src = _restore_protected_spans(src, stash)
 
         # 3. Markdown → HTML
-        html = markdown.markdown(src, extensions=_MD_EXTENSIONS)
-        html = _sanitize_html_fragment(html, profile="html")
+        html = self._markdown_parser().convert(src)
+        html = self._sanitize_fragment(html, profile="html")
         return f'<div class="md-cell">{html}</div>\n'
 
     def _code_cell(self, cell, tags: frozenset[str] = frozenset()) -> str:
@@ -182,10 +257,13 @@ class Converter:
             ec = cell.get("execution_count")
             footer_left = f"[{ec}]" if ec is not None else "[ ]"
             footer_right = cell_lang.capitalize() if cell_lang else ""
-            png_parts.append(
-                render_code(cell.source, cell_lang, self.config.code,
-                            apply_padding=False)
-            )
+            key = (cell.source, cell_lang)
+            png = self._code_png_cache.get(key)
+            if png is None:
+                png = render_code(cell.source, cell_lang, self.config.code,
+                                  apply_padding=False)
+                self._code_png_cache[key] = png
+            png_parts.append(png)
 
         if "hide-output" not in tags:
             for output in cell.get("outputs", []):
@@ -200,16 +278,18 @@ class Converter:
         if not png_parts and not rich_parts:
             return ""
 
-        parts: list[str] = []
+        parts: list[str] = ['<div class="code-cell">\n']
         if png_parts:
             merged = vstack_and_pad(png_parts, self.config.code,
                                     draw_code_border=has_code,
                                     code_footer_left=footer_left,
                                     code_footer_right=footer_right)
-            parts.append(f'<img class="code-img" src="{_png_uri(merged)}" alt="code">\n')
+            parts += ('<img class="code-img" src="', _png_uri(merged), '" alt="code">\n')
         parts.extend(rich_parts)
+        parts.append("</div>\n")
 
-        return '<div class="code-cell">\n' + "".join(parts) + "</div>\n"
+        # Single join: the (large) data URI is copied once, into the result.
+        return "".join(parts)
 
     def _output_as_png(self, output) -> bytes | None:
         """Render text-based outputs to PNG for merging; return None for rich outputs."""
@@ -219,24 +299,42 @@ class Converter:
             return self._text_output_to_png(_join_text(output.get("text")))
 
         if otype == "error":
-            traceback = _ANSI.sub("", _join_text(output.get("traceback"), sep="\n"))
+            traceback = _strip_ansi(_join_text(output.get("traceback"), sep="\n"))
             return self._text_output_to_png(traceback)
 
         data = _rich_output_data(output)
         if data is None:
             return None
 
-        if any(mime in data for mime in _RICH_OUTPUT_MIMES):
+        if not _RICH_OUTPUT_MIMES.isdisjoint(data):
             return None  # handled as a rich fragment
 
         return self._text_output_to_png(_join_text(data.get("text/plain")))
 
     def _text_output_to_png(self, text: str) -> bytes | None:
         """Render non-empty text output as PNG bytes."""
-        if text.strip():
-            return render_output_text(text, self.config.code, apply_padding=False)
+        if not text.strip():
+            return None
 
-        return None
+        png = self._text_png_cache.get(text)
+        if png is None:
+            png = render_output_text(text, self.config.code, apply_padding=False)
+            self._text_png_cache[text] = png
+        return png
+
+    def _sanitize_fragment(self, fragment: str, *, profile: str) -> str:
+        """Sanitize *fragment*, memoizing fragments up to ``_SANITIZE_CACHE_MAX_CHARS``.
+
+        Notebooks often repeat the same table header, widget or SVG output.
+        """
+        if len(fragment) > _SANITIZE_CACHE_MAX_CHARS:
+            return _sanitize_html_fragment(fragment, profile=profile)
+        key = (fragment, profile)
+        sanitized = self._sanitize_cache.get(key)
+        if sanitized is None:
+            sanitized = _sanitize_html_fragment(fragment, profile=profile)
+            self._sanitize_cache[key] = sanitized
+        return sanitized
 
     def _render_output(self, output) -> str:
         """Return HTML fragment for rich outputs (notebook PNG, SVG, HTML)."""
@@ -250,30 +348,67 @@ class Converter:
 
         raw_svg = _join_text(data.get("image/svg+xml"))
         if raw_svg:
-            return f'<img src="{_svg_data_uri(raw_svg)}" alt="output">\n'
+            sanitized = self._sanitize_fragment(raw_svg, profile="svg")
+            uri = _data_uri("image/svg+xml", sanitized.encode("utf-8"))
+            return f'<img src="{uri}" alt="output">\n'
 
         raw_html = _join_text(data.get("text/html"))
         if raw_html:
-            sanitized = _sanitize_html_fragment(raw_html, profile="html")
+            sanitized = self._sanitize_fragment(raw_html, profile="html")
             return f'<div class="html-output">{sanitized}</div>\n'
 
         return ""
 
 
+# ---------------------------------------------------------------------------
+# Process-pool workers
+# ---------------------------------------------------------------------------
+
+_worker_converter: Converter | None = None
+
+
+def _init_render_worker(
+    config: Config,
+    lang: str,
+    latex_preamble: str,
+    eq_labels: dict[str, int],
+) -> None:
+    """Set up the per-process converter used by ``_render_cell_in_worker``."""
+    global _worker_converter
+    converter = Converter(config)
+    converter._lang = lang
+    converter._latex_preamble = latex_preamble
+    converter._eq_labels = eq_labels
+    _worker_converter = converter
+
+
+def _render_cell_in_worker(
+    job: tuple[Any, frozenset[str]],
+) -> tuple[str, list[tuple[str, type[Warning]]]]:
+    """Render one cell in a worker process, capturing warnings for the parent."""
+    cell, tags = job
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        html = _worker_converter._render_cell(cell, tags)
+    return html, [(str(w.message), w.category) for w in caught]
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _png_uri(png_bytes: bytes) -> str:
-    """Encode raw PNG bytes as a ``data:image/png;base64,...`` URI."""
-    return "data:image/png;base64," + base64.b64encode(png_bytes).decode("ascii")
+def _data_uri(mime: str, payload: bytes) -> str:
+    """Encode *payload* as a ``data:<mime>;base64,...`` URI.
+
+    The base64 text is produced once by ``b2a_base64`` and copied once more
+    into the final string; staging it in a bytearray would not save a copy.
+    """
+    return f"data:{mime};base64," + b2a_base64(payload, newline=False).decode("ascii")
 
 
-def _svg_data_uri(svg: str) -> str:
-    """Encode sanitized SVG markup as a data URI for safe embedding via <img>."""
-    sanitized = _sanitize_html_fragment(svg, profile="svg")
-    encoded = base64.b64encode(sanitized.encode("utf-8")).decode("ascii")
-    return f"data:image/svg+xml;base64,{encoded}"
+def _png_uri(png_bytes: bytes) -> str:
+    """Encode raw PNG bytes as a ``data:image/png;base64,...`` URI."""
+    return _data_uri("image/png", png_bytes)
 
 
 def _sanitize_html_fragment(fragment: str, *, profile: str = "html") -> str:
@@ -284,8 +419,31 @@ def _sanitize_html_fragment(fragment: str, *, profile: str = "html") -> str:
         return ""
 
 
+def _strip_ansi(text: str) -> str:
+    """Remove ANSI escape sequences (``ESC [ params final``) from *text*.
+
+    Splits on the ``ESC [`` introducer and strips each sequence with C-level
+    string operations instead of running a regex over the whole traceback.
+    Introducers not followed by a valid sequence are kept verbatim.
+    """
+    if "\x1b" not in text:
+        return text  # most tracebacks carry no escape codes at all
+    segments = text.split(_ANSI_PREFIX)
+    out = [segments[0]]
+    for segment in segments[1:]:
+        rest = segment.lstrip(_ANSI_PARAMS)
+        if rest[:1] in _ANSI_FINALS:
+            out.append(rest[1:])
+        else:
+            out.append(_ANSI_PREFIX + segment)
+    return "".join(out)
+
+
 def _apply_eq_tag(latex: str, eq_labels: dict[str, int]) -> tuple[str, int | None]:
     """Strip \\label{...} from latex; return (clean_latex, tag_number_or_None)."""
+    if "\\label" not in latex:
+        return latex.strip(), None  # most blocks are unlabelled: skip the regex
+
     tag_num = None
 
     def _sub(m: re.Match) -> str:
@@ -304,7 +462,10 @@ def _join_text(value: Any, *, sep: str = "") -> str:
     if isinstance(value, str):
         return value
     if isinstance(value, list):
-        return sep.join(part for part in value if isinstance(part, str))
+        try:
+            return sep.join(value)  # nbformat guarantees list[str] in practice
+        except TypeError:
+            return sep.join(part for part in value if isinstance(part, str))
     return ""
 
 
@@ -324,16 +485,83 @@ def _protect_markdown_code_spans(src: str) -> tuple[str, list[str]]:
         stash.append(match.group(0))
         return _PROTECTED_TOKEN.format(len(stash) - 1)
 
-    src = _FENCED_CODE_RE.sub(_protect, src)
-    src = _INLINE_CODE_RE.sub(_protect, src)
-    return src, stash
+    def _protect_inline(text: str) -> str:
+        return _INLINE_CODE_RE.sub(_protect, text) if "`" in text else text
+
+    if "`" not in src:
+        return src, stash
+
+    # One pass over the cell: fenced blocks are stashed whole and the inline
+    # pattern runs only on the text between them.  Fenced spans cover whole
+    # lines and inline spans never cross a newline, so this finds exactly the
+    # spans that two sequential substitutions would.
+    pieces: list[str] = []
+    pos = 0
+    for start, end in _find_fenced_code_spans(src):
+        pieces.append(_protect_inline(src[pos:start]))
+        stash.append(src[start:end])
+        pieces.append(_PROTECTED_TOKEN.format(len(stash) - 1))
+        pos = end
+    pieces.append(_protect_inline(src[pos:]))
+    return "".join(pieces), stash
+
+
+def _find_fenced_code_spans(src: str) -> list[tuple[int, int]]:
+    """Return ``(start, end)`` offsets of fenced code blocks in *src*.
+
+    A linear scan equivalent to substituting
+    ``^(`{3,})[^\n]*\n.*?\1[ \t]*$`` (MULTILINE | DOTALL): a line opening
+    with *n* >= 3 backticks is closed by the first later line whose text,
+    minus trailing spaces/tabs, ends in at least *k* backticks, where *k* is
+    the largest fence length <= *n* that some later line can close.  Spans
+    end before the closing line's newline.
+    """
+    if "```" not in src:
+        return []
+
+    lines = src.split("\n")
+    # Length of each line's trailing backtick run (ignoring trailing blanks).
+    closers: list[int] = []
+    for line in lines:
+        stripped = line.rstrip(" \t")
+        closers.append(len(stripped) - len(stripped.rstrip("`")))
+    # longest_after[i]: longest closing run on any line after line i.
+    longest_after = [0] * len(lines)
+    longest = 0
+    for i in range(len(lines) - 1, -1, -1):
+        longest_after[i] = longest
+        if closers[i] > longest:
+            longest = closers[i]
+
+    spans: list[tuple[int, int]] = []
+    offset = 0
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        if longest_after[i] >= 3 and line.startswith("```"):
+            fence = min(len(line) - len(line.lstrip("`")), longest_after[i])
+            start = offset
+            offset += len(line) + 1
+            i += 1
+            while closers[i] < fence:
+                offset += len(lines[i]) + 1
+                i += 1
+            spans.append((start, offset + len(lines[i])))
+        offset += len(lines[i]) + 1
+        i += 1
+    return spans
 
 
 def _restore_protected_spans(src: str, stash: list[str]) -> str:
     """Restore code spans previously stashed by ``_protect_markdown_code_spans``."""
-    for i, block in enumerate(stash):
-        src = src.replace(_PROTECTED_TOKEN.format(i), block)
-    return src
+    if not stash:
+        return src  # nothing was protected: skip the placeholder scan
+
+    def _restore(m: re.Match) -> str:
+        i = int(m.group(1))
+        return stash[i] if i < len(stash) else m.group(0)
+
+    return _PROTECTED_TOKEN_RE.sub(_restore, src)
 
 
 def _cell_tags(cell) -> frozenset[str]:
@@ -349,37 +577,48 @@ def _skip_cell(tags: frozenset[str]) -> bool:
     return "hide-cell" in tags or "latex-preamble" in tags
 
 
-def _collect_latex_preamble(cells) -> str:
-    """Collect LaTeX preamble snippets from ``latex-preamble`` tagged cells."""
-    preamble_parts: list[str] = []
-    for cell in cells:
-        if "latex-preamble" in _cell_tags(cell):
-            source = _join_text(getattr(cell, "source", ""))
-            if source.strip():
-                preamble_parts.append(source.strip())
-    return "\n".join(preamble_parts)
-
+def _collect_doc_metadata(
+    cells,
+    display_math: list[list[tuple[int, int, str]]] | None = None,
+    cell_tags: list[frozenset[str]] | None = None,
+) -> tuple[str, dict[str, int]]:
+    """Collect the LaTeX preamble and equation labels in one pass over *cells*.
 
-def _collect_equation_labels(cells) -> dict[str, int]:
-    """Collect document-level equation labels in source order."""
+    Returns ``(preamble, labels)``: the stripped sources of ``latex-preamble``
+    tagged cells joined by newlines, and document-level equation labels
+    numbered in source order.  *display_math* optionally supplies each cell's
+    already-extracted display-math blocks (as returned by
+    ``_enforce_notebook_limits``), and *cell_tags* each cell's precomputed tags.
+    """
+    preamble_parts: list[str] = []
     labels: dict[str, int] = {}
     counter = 1
-    for cell in cells:
-        tags = _cell_tags(cell)
-        if _skip_cell(tags) or cell.cell_type != "markdown":
+    for idx, cell in enumerate(cells):
+        tags = cell_tags[idx] if cell_tags is not None else _cell_tags(cell)
+        if "latex-preamble" in tags:
+            source = _join_text(getattr(cell, "source", "")).strip()
+            if source:
+                preamble_parts.append(source)
             continue
-        source = _join_text(getattr(cell, "source", ""))
-        for _, _, latex in extract_display_math(source):
+        if "hide-cell" in tags or cell.cell_type != "markdown":
+            continue
+        if display_math is not None:
+            blocks = display_math[idx]
+        else:
+            blocks = extract_display_math(_join_text(getattr(cell, "source", "")))
+        for _, _, latex in blocks:
+            if "\\label" not in latex:
+                continue
             for match in _LABEL_RE.finditer(latex):
                 label = match.group(1)
                 if label in labels:
                     continue
                 labels[label] = counter
                 counter += 1
-    return labels
+    return "\n".join(preamble_parts), labels
 
 
-def _load_notebook(notebook_path: Path, *, execute: bool) -> Any:
+def _load_notebook(notebook_path: Path, *, execute: bool, validate: bool = True) -> Any:
     """Load and optionally execute notebook-like sources."""
     suffix = notebook_path.suffix.lower()
     if suffix == ".qmd":
@@ -387,11 +626,40 @@ def _load_notebook(notebook_path: Path, *, execute: bool) -> Any:
     elif suffix == ".md":
         nb = read_md(notebook_path)
     else:
-        nb = nbformat.read(str(notebook_path), as_version=4)
+        nb = _read_ipynb(notebook_path, validate=validate)
 
     return _execute_cells(nb, notebook_path.parent) if execute else nb
 
 
+def _read_ipynb(notebook_path: Path, *, validate: bool = True) -> Any:
+    """Read an ``.ipynb`` file as a v4 notebook, parsing JSON with orjson when installed.
+
+    Mirrors ``nbformat.read(..., as_version=4)``: upgrade older formats and
+    log (rather than raise) schema violations.  With ``validate=False`` the
+    schema walk is skipped entirely.
+    """
+    data = notebook_path.read_bytes()
+    if _orjson is not None:
+        try:
+            nb_dict = _orjson.loads(data)
+        except _orjson.JSONDecodeError:
+            # orjson is strict JSON; nbformat itself writes NaN/Infinity,
+            # which only the stdlib parser accepts.
+            nb_dict = parse_json(data)
+    else:
+        nb_dict = parse_json(data)
+    major, minor = get_version(nb_dict)
+    if major not in nbformat.versions:
+        raise nbformat.NBFormatError(f"Unsupported nbformat version {major}")
+    nb = nbformat.convert(nbformat.versions[major].to_notebook_json(nb_dict, minor=minor), 4)
+    if validate:
+        try:
+            nbformat.validate(nb)
+        except nbformat.ValidationError as exc:
+            nbformat.get_logger().error("Notebook JSON is invalid: %s", exc)
+    return nb
+
+
 def _enforce_input_size(path: Path, safety: SafetyConfig) -> None:
     """Reject oversized input files before parsing."""
     try:
@@ -417,8 +685,12 @@ def _enforce_serialized_notebook_size(nb, safety: SafetyConfig) -> None:
         )
 
 
-def _enforce_notebook_limits(nb, safety: SafetyConfig) -> None:
-    """Apply server-safe notebook limits for resource usage and payload size."""
+def _enforce_notebook_limits(nb, safety: SafetyConfig) -> list[list[tuple[int, int, str]]]:
+    """Apply server-safe notebook limits for resource usage and payload size.
+
+    Returns the display-math blocks extracted from each cell (empty for
+    non-markdown cells) so later passes can reuse them.
+    """
     cells = getattr(nb, "cells", [])
     if len(cells) > safety.max_cells:
         raise ValueError(
@@ -428,6 +700,7 @@ def _enforce_notebook_limits(nb, safety: SafetyConfig) -> None:
     total_output_bytes = 0
     total_display_math_blocks = 0
     total_latex_chars = 0
+    display_math: list[list[tuple[int, int, str]]] = []
     for idx, cell in enumerate(cells):
         source = _join_text(getattr(cell, "source", ""))
         if len(source) > safety.max_cell_source_chars:
@@ -436,6 +709,7 @@ def _enforce_notebook_limits(nb, safety: SafetyConfig) -> None:
                 f"({len(source)} > {safety.max_cell_source_chars} chars)."
             )
 
+        blocks = []
         if getattr(cell, "cell_type", "") == "markdown":
             blocks = extract_display_math(source)
             total_display_math_blocks += len(blocks)
@@ -450,6 +724,7 @@ def _enforce_notebook_limits(nb, safety: SafetyConfig) -> None:
                     "Notebook has too much display-math content "
                     f"({total_latex_chars} > {safety.max_total_latex_chars} chars)."
                 )
+        display_math.append(blocks)
 
         for output in cell.get("outputs", []):
             total_output_bytes += _estimate_payload_size(output)
@@ -458,6 +733,7 @@ def _enforce_notebook_limits(nb, safety: SafetyConfig) -> None:
                     "Notebook outputs exceed safety limit "
                     f"({total_output_bytes} > {safety.max_total_output_bytes} bytes)."
                 )
+    return display_math
 
 
 def _estimate_payload_size(value: Any) -> int:
@@ -491,6 +767,12 @@ def _notebook_language(nb) -> str:
 
 def _execute_cells(nb, cwd: Path):
     """Execute all code cells in *nb* via a Jupyter kernel and return the notebook."""
+    if not any(
+        cell.get("cell_type") == "code" and _join_text(cell.get("source")).strip()
+        for cell in nb.cells
+    ):
+        return nb  # nothing to run: skip importing nbconvert and starting a kernel
+
     try:
         from nbconvert.preprocessors import ExecutePreprocessor
     except ImportError:
@@ -18,6 +18,7 @@ Markdown format support
 from __future__ import annotations
 
 import re
+from bisect import bisect_right
 from pathlib import Path
 from typing import Any
 
@@ -26,12 +27,10 @@ import nbformat
 from ._reader_utils import make_notebook, split_front_matter as _split_front_matter
 
 
-# Standard fenced code block: ```lang [tags...]\n...\n```  (3+ backticks or tildes)
-# Group 1: fence chars, Group 2: language, Group 3: rest of fence line (tags), Group 4: body
-_MD_CODE_RE = re.compile(
-    r"^(`{3,}|~{3,})(\S*)([ \t][^\n]*)?\n(.*?)^\1[ \t]*$",
-    re.DOTALL | re.MULTILINE,
-)
+# Standard fenced code blocks (3+ backticks or tildes) are located by
+# ``_find_code_blocks``, a line scanner equivalent to the pattern
+#   ^(`{3,}|~{3,})(\S*)([ \t][^\n]*)?\n(.*?)^\1[ \t]*$   (DOTALL | MULTILINE)
+_FENCE_CHARS = ("`", "~")
 
 # nb2wb directives on their own line: <!-- nb2wb: hide-input -->
 _NB2WB_COMMENT_RE = re.compile(
@@ -67,8 +66,8 @@ def _detect_language(fm: dict[str, Any], text: str) -> str:
         return str(jupyter["kernel"])
     # Infer from the first non-special code block
     _SPECIAL_LANGS = {"latex-preamble"}
-    for m in _MD_CODE_RE.finditer(text):
-        lang = m.group(2).strip()
+    for _, _, lang, _, _ in _find_code_blocks(text):
+        lang = lang.strip()
         if lang and lang not in _SPECIAL_LANGS:
             # Strip fence-line tags from language (only want the lang itself)
             return lang
@@ -84,9 +83,9 @@ def _extract_cells(text: str, default_lang: str) -> list[nbformat.NotebookNode]:
     cells: list[nbformat.NotebookNode] = []
     pos = 0
 
-    for m in _MD_CODE_RE.finditer(text):
+    for start, end, lang, fence_rest, body in _find_code_blocks(text):
         # Markdown between the previous code block and this one
-        md_text = text[pos:m.start()]
+        md_text = text[pos:start]
 
         # Extract and consume nb2wb directives from the markdown
         pending_tags: list[str] = []
@@ -97,9 +96,8 @@ def _extract_cells(text: str, default_lang: str) -> list[nbformat.NotebookNode]:
             cells.append(nbformat.v4.new_markdown_cell(md_text))
 
         # Parse the code block
-        lang = m.group(2).strip() or default_lang
-        fence_rest = (m.group(3) or "").strip()
-        body = m.group(4)
+        lang = lang.strip() or default_lang
+        fence_rest = fence_rest.strip()
 
         # Parse space-separated tags from the fence line (e.g. ```python hide-input)
         fence_tags = fence_rest.split() if fence_rest else []
@@ -117,7 +115,7 @@ def _extract_cells(text: str, default_lang: str) -> list[nbformat.NotebookNode]:
                 cell.metadata["tags"] = all_tags
 
         cells.append(cell)
-        pos = m.end()
+        pos = end
 
     # Trailing markdown after the last code block
     md_text = text[pos:]
@@ -131,6 +129,82 @@ def _extract_cells(text: str, default_lang: str) -> list[nbformat.NotebookNode]:
     return cells
 
 
+def _find_code_blocks(text: str) -> list[tuple[int, int, str, str, str]]:
+    """Return ``(start, end, lang, fence_rest, body)`` for each fenced code block.
+
+    Scans *text* line by line.  A line opening with *n* >= 3 backticks (or
+    tildes) followed by a non-space word and, optionally, blank-separated
+    tags opens a block; it is closed by the first later line consisting of
+    exactly *k* of the same fence character plus trailing spaces/tabs, where
+    *k* is the largest length <= *n* that some later line closes.  When
+    *k* < *n* the surplus fence characters lead ``lang``, as with the regex
+    this replaces.  Blocks end before the closing line's newline.
+    """
+    if "```" not in text and "~~~" not in text:
+        return []
+
+    lines = text.split("\n")
+    # Line indices of closing fences, keyed on (fence char, exact length).
+    closers: dict[tuple[str, int], list[int]] = {}
+    for idx, line in enumerate(lines):
+        stripped = line.rstrip(" \t")
+        char = stripped[:1]
+        if char in _FENCE_CHARS and len(stripped) >= 3 and not stripped.lstrip(char):
+            closers.setdefault((char, len(stripped)), []).append(idx)
+    # Candidate closing lengths per fence char, longest first.
+    lengths = {
+        char: sorted((k for c, k in closers if c == char), reverse=True)
+        for char in _FENCE_CHARS
+    }
+
+    blocks: list[tuple[int, int, str, str, str]] = []
+    offsets = [0] * len(lines)
+    offset = 0
+    for idx, line in enumerate(lines):
+        offsets[idx] = offset
+        offset += len(line) + 1
+
+    i = 0
+    last = len(lines) - 1  # the final line has no newline and cannot open
+    while i < last:
+        line = lines[i]
+        char = line[:1]
+        if char not in _FENCE_CHARS or not line.startswith(char * 3):
+            i += 1
+            continue
+        n = len(line) - len(line.lstrip(char))
+        word_end = n
+        while word_end < len(line) and not line[word_end].isspace():
+            word_end += 1
+        if word_end < len(line) and line[word_end] not in " \t":
+            i += 1  # e.g. a trailing "\r": the fence line never matches
+            continue
+
+        close = None
+        for k in lengths[char]:
+            if k > n:
+                continue
+            candidates = closers[(char, k)]
+            pos = bisect_right(candidates, i)
+            if pos < len(candidates):
+                close = (k, candidates[pos])
+                break
+        if close is None:
+            i += 1
+            continue
+
+        k, j = close
+        blocks.append((
+            offsets[i],
+            offsets[j] + len(lines[j]),
+            line[k:word_end],
+            line[word_end:],
+            text[offsets[i + 1]:offsets[j]],
+        ))
+        i = j + 1
+    return blocks
+
+
 def _consume_directives(text: str, tags: list[str]) -> str:
     """Remove nb2wb HTML comment directives from *text*, collecting tags.
 
@@ -3,7 +3,8 @@ Shared HTML/CSS/JS templates for platform preview pages.
 """
 from __future__ import annotations
 
-from string import Template
+import functools
+import re
 from typing import Mapping
 
 _BASE_THEME: dict[str, str] = {
@@ -57,6 +58,14 @@ _BASE_THEME: dict[str, str] = {
     "code-image-radius": "5px",
 }
 
+
+def _theme_vars(theme: Mapping[str, str]) -> str:
+    """Render *theme* as CSS custom property declarations for ``:root``."""
+    return "\n".join(f"      --{name}: {value};" for name, value in theme.items())
+
+
+_BASE_THEME_VARS = _theme_vars(_BASE_THEME)
+
 COPYABLE_SCRIPT = """\
     async function copyContent() {
       var btn = document.getElementById("copy-btn");
@@ -177,8 +186,7 @@ SIMPLE_COPY_SCRIPT = """\
     }
 """
 
-_PAGE_TEMPLATE = Template(
-    """\
+_PAGE_TEMPLATE = """\
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -352,9 +360,48 @@ $script
 </body>
 </html>
 """
+
+
+# Everything around $content_html depends only on the builder's fixed
+# arguments, so each page shell is rendered once and reused.  Placeholders
+# are located once here; each half is stored as alternating literal text
+# and field names.
+_PLACEHOLDER_RE = re.compile(r"\$([a-z_]+)")
+_PAGE_HEAD_PARTS, _PAGE_TAIL_PARTS = (
+    tuple(_PLACEHOLDER_RE.split(part)) for part in _PAGE_TEMPLATE.split("$content_html")
 )
 
 
+def _interpolate(parts: tuple[str, ...], fields: Mapping[str, str]) -> str:
+    """Join *parts* (literal, name, literal, ...) with each name's field value."""
+    return "".join(fields[part] if i % 2 else part for i, part in enumerate(parts))
+
+
+@functools.lru_cache(maxsize=32)
+def _page_shell(
+    title: str,
+    toolbar_message: str,
+    script: str,
+    theme_items: tuple[tuple[str, str], ...],
+    extra_css: str,
+) -> tuple[str, str]:
+    """Render the page HTML before and after the content block."""
+    if theme_items:
+        theme = dict(_BASE_THEME)
+        theme.update(theme_items)
+        theme_vars = _theme_vars(theme)
+    else:
+        theme_vars = _BASE_THEME_VARS
+    fields = {
+        "title": title,
+        "theme_vars": theme_vars,
+        "toolbar_message": toolbar_message,
+        "script": script,
+        "extra_css": extra_css,
+    }
+    return _interpolate(_PAGE_HEAD_PARTS, fields), _interpolate(_PAGE_TAIL_PARTS, fields)
+
+
 def build_page(
     content_html: str,
     *,
@@ -365,17 +412,12 @@ def build_page(
     extra_css: str = "",
 ) -> str:
     """Build a complete HTML preview page."""
-    theme = dict(_BASE_THEME)
-    if theme_overrides:
-        theme.update(theme_overrides)
-    theme_vars = "\n".join(
-        f"      --{name}: {value};" for name, value in theme.items()
-    )
-    return _PAGE_TEMPLATE.substitute(
-        title=title,
-        theme_vars=theme_vars,
-        toolbar_message=toolbar_message,
-        content_html=content_html,
-        script=script,
-        extra_css=extra_css,
-    )
+    theme_items = tuple(theme_overrides.items()) if theme_overrides else ()
+    shell_args = (title, toolbar_message, script, theme_items, extra_css)
+    try:
+        hash(shell_args)
+    except TypeError:  # unhashable override values: render without caching
+        head, tail = _page_shell.__wrapped__(*shell_args)
+    else:
+        head, tail = _page_shell(*shell_args)
+    return "".join((head, content_html, tail))
@@ -3,24 +3,52 @@ Abstract base class for platform-specific HTML builders.
 """
 from __future__ import annotations
 
-import base64
+import contextlib
+import functools
 import ipaddress
 import mimetypes
+import os
 import re
 import socket
+import stat
+import time
 import warnings
 import urllib.request
 from abc import ABC, abstractmethod
+from binascii import b2a_base64
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Iterator
 from urllib.parse import urlparse
 
+try:  # optional SIMD base64 for large images: ``pip install nb2wb[fast]``
+    from pybase64 import b64encode as _b64encode
+except ImportError:
+    def _b64encode(data: bytes | memoryview) -> bytes:
+        return b2a_base64(data, newline=False)
+
 # Maximum image download size: 50 MB
 _MAX_IMAGE_BYTES = 50 * 1024 * 1024
 
 # URL fetch timeout in seconds
 _URL_TIMEOUT = 30
 
+# Maximum age in seconds of a cached DNS answer for the private-host check
+_DNS_CACHE_TTL = 10
+
+# Upper bound on concurrent remote image fetches per page
+_MAX_FETCH_WORKERS = 8
+
+# Read size for streamed base64 encoding; a multiple of 3 so full chunks
+# encode without padding.
+_B64_CHUNK_BYTES = 57 * 1024
+
+# Flags for opening local images: read-only, binary on Windows, and
+# non-blocking so a FIFO is rejected rather than waited on.
+_IMAGE_OPEN_FLAGS = (
+    os.O_RDONLY | getattr(os, "O_BINARY", 0) | getattr(os, "O_NONBLOCK", 0)
+)
+
 # Allowed image MIME types
 _ALLOWED_IMAGE_MIMES = frozenset({
     "image/png",
@@ -41,26 +69,87 @@ MIME_TO_EXT: dict[str, str] = {
     "image/webp": ".webp",
 }
 
+# The lazy scan stops at the first whitespace-delimited ``src`` attribute,
+# so long data URIs are walked once instead of being backtracked over, and
+# attributes such as ``data-src`` are never mistaken for the source.  The
+# tag is captured as (head, src, tail) so callers can inspect the other
+# attributes without rescanning the source value.
 _IMG_TAG_RE = re.compile(
-    r'<img\s+[^>]*src="([^"]+)"[^>]*/?>',
+    r'(<img(?=\s)[^>]*?\ssrc=")([^"]+)("[^>]*>)',
     re.IGNORECASE,
 )
 
-_ALT_ATTR_RE = re.compile(r'alt="([^"]*)"')
+
+# Any ``src`` value that is not already a data URI.  When this finds
+# nothing, no matched ``<img>`` can need its source converted.
+_NON_DATA_SRC_RE = re.compile(r'(?i:src=")(?!data:)')
 
 
 def _rewrite_img_tags(
     html: str,
-    rewrite: Callable[[str, str], str],
+    rewrite: Callable[[str, str, str], str],
 ) -> str:
-    """Rewrite ``<img ... src="...">`` tags using *rewrite(full_tag, src)*."""
+    """Rewrite ``<img ... src="...">`` tags using *rewrite(head, src, tail)*.
+
+    *head* runs from ``<img`` through ``src="`` and *tail* from the closing
+    quote through ``>``, so ``head + src + tail`` is the original tag.
+    """
 
     def _sub(match: re.Match[str]) -> str:
-        return rewrite(match.group(0), match.group(1))
+        return rewrite(*match.groups())
 
     return _IMG_TAG_RE.sub(_sub, html)
 
 
+def _img_alt(head: str, tail: str) -> str:
+    """Return the ``alt`` text of a split ``<img>`` tag, or ``"image"``.
+
+    Takes the first ``alt="..."`` in *head*, then in *tail*, using plain
+    substring scans.
+    """
+    for part in (head, tail):
+        start = part.find('alt="')
+        if start >= 0:
+            start += 5
+            end = part.find('"', start)
+            if end >= 0:
+                return part[start:end]
+    return "image"
+
+
+def _iter_b64(
+    readinto: Callable[[memoryview], int | None],
+    *,
+    limit: int,
+) -> Iterator[str]:
+    """Yield the base64 encoding of the stream behind *readinto*, chunk by chunk.
+
+    Reads land in one preallocated buffer, so no bytes object is created per
+    chunk.  The 0-2 bytes left over after each 3-byte-aligned slice are moved
+    to the front of the buffer, so the joined output equals one-shot
+    encoding.  Raises ``ValueError`` once more than *limit* raw bytes have
+    been read.
+    """
+    view = memoryview(bytearray(_B64_CHUNK_BYTES))
+    total = 0
+    filled = 0
+    while True:
+        n = readinto(view[filled:])
+        if not n:
+            break
+        total += n
+        if total > limit:
+            raise ValueError(f"Image exceeds {limit} byte limit")
+        filled += n
+        cut = filled - filled % 3
+        if cut:
+            yield _b64encode(view[:cut]).decode("ascii")
+            filled -= cut
+            view[:filled] = view[cut:cut + filled]
+    if filled:
+        yield _b64encode(view[:filled]).decode("ascii")
+
+
 def _validate_public_http_url(url: str, *, context: str = "Image URL") -> str:
     """Validate that *url* is HTTP(S) and does not resolve to private hosts."""
     parsed = urlparse(url)
@@ -89,19 +178,49 @@ class _SafeRedirectHandler(urllib.request.HTTPRedirectHandler):
         return super().redirect_request(req, fp, code, msg, headers, newurl)
 
 
+@functools.lru_cache(maxsize=1)
+def _image_opener() -> urllib.request.OpenerDirector:
+    """Return the shared opener for image fetches.
+
+    Built on first use rather than at import, so proxy settings are read
+    from the environment when the first image is fetched, as with
+    ``urllib.request.urlopen``'s global opener.
+    """
+    return urllib.request.build_opener(_SafeRedirectHandler())
+
+
+def _is_non_public(addr: ipaddress.IPv4Address | ipaddress.IPv6Address) -> bool:
+    return (
+        addr.is_private
+        or addr.is_loopback
+        or addr.is_link_local
+        or addr.is_multicast
+        or addr.is_reserved
+        or addr.is_unspecified
+        or not addr.is_global
+    )
+
+
+def _resolve_host(hostname: str) -> tuple[str, ...]:
+    """Return the stream endpoint addresses of *hostname*.
+
+    Successful lookups are memoized for at most ``_DNS_CACHE_TTL`` seconds,
+    so the images of one page share a lookup while a host that later
+    rebinds to a private address is re-checked soon after.  ``OSError``
+    propagates and is not cached.
+    """
+    return _resolve_host_cached(hostname, int(time.monotonic() // _DNS_CACHE_TTL))
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_host_cached(hostname: str, _window: int) -> tuple[str, ...]:
+    """Resolve *hostname*; cached per ``_DNS_CACHE_TTL``-second window."""
+    infos = socket.getaddrinfo(hostname, None, type=socket.SOCK_STREAM)
+    return tuple(str(sockaddr[0]) for *_rest, sockaddr in infos)
+
+
 def _is_private_host(hostname: str) -> bool:
     """Return True if *hostname* is not globally routable."""
-    def _is_non_public(addr: ipaddress.IPv4Address | ipaddress.IPv6Address) -> bool:
-        return (
-            addr.is_private
-            or addr.is_loopback
-            or addr.is_link_local
-            or addr.is_multicast
-            or addr.is_reserved
-            or addr.is_unspecified
-            or not addr.is_global
-        )
-
     try:
         addr = ipaddress.ip_address(hostname)
         return _is_non_public(addr)
@@ -110,16 +229,12 @@ def _is_private_host(hostname: str) -> bool:
 
     # Hostname like "localhost" — resolve and reject if any endpoint is non-global.
     try:
-        infos = socket.getaddrinfo(hostname, None, type=socket.SOCK_STREAM)
-        if not infos:
-            return True
-        for _family, _type, _proto, _canonname, sockaddr in infos:
-            addr = ipaddress.ip_address(sockaddr[0])
-            if _is_non_public(addr):
-                return True
+        addrs = _resolve_host(hostname)
     except OSError:
         return True
-    return False
+    if not addrs:
+        return True
+    return any(_is_non_public(ipaddress.ip_address(addr)) for addr in addrs)
 
 
 def _extract_peer_ip(response) -> str | None:
@@ -161,6 +276,14 @@ class PlatformBuilder(ABC):
     and interactive features. Subclasses implement platform-specific rendering.
     """
 
+    def __init__(self) -> None:
+        # Converted image sources keyed by ``src``.  Emptied around every
+        # image pass by ``_page_image_scope``, so entries live for one page
+        # however long the builder itself is kept.
+        self._data_uri_cache: dict[str, str] = {}
+        # In-flight remote fetches started by ``_prefetching_remote_images``.
+        self._pending_fetches: dict[str, Future[str]] = {}
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -189,13 +312,11 @@ class PlatformBuilder(ABC):
     ) -> str:
         """Rewrite image ``src`` values while preserving all other attributes."""
 
-        def rewrite_image(full_tag: str, img_src: str) -> str:
+        def rewrite_image(head: str, img_src: str, tail: str) -> str:
             new_src = rewrite_src(img_src)
             if not new_src:
                 return ""
-            if new_src == img_src:
-                return full_tag
-            return full_tag.replace(f'src="{img_src}"', f'src="{new_src}"', 1)
+            return head + new_src + tail
 
         return _rewrite_img_tags(html, rewrite_image)
 
@@ -206,34 +327,98 @@ class PlatformBuilder(ABC):
         - URLs: blocks private/loopback hosts (SSRF), enforces timeout and
           size limit, validates MIME type.
         - File paths: rejects absolute paths and ``..`` traversal.
+
+        Results, including failures, are cached for the current page, so an
+        image repeated on a page is fetched or read, and warned about, once.
         """
+        cached = self._data_uri_cache.get(src)
+        if cached is not None:
+            return cached
         try:
             if src.startswith(("http://", "https://")):
-                return self._fetch_url_as_data_uri(src)
-            return self._read_file_as_data_uri(src)
+                pending = self._pending_fetches.pop(src, None)
+                if pending is not None:
+                    uri = pending.result()
+                else:
+                    uri = self._fetch_url_as_data_uri(src)
+            else:
+                uri = self._read_file_as_data_uri(src)
         except Exception as exc:
             warnings.warn(
                 f"Could not convert image '{src}' to data URI: {exc}",
                 RuntimeWarning,
                 stacklevel=2,
             )
-            return ""
+            uri = ""
+        self._data_uri_cache[src] = uri
+        return uri
+
+    @contextlib.contextmanager
+    def _page_image_scope(self, html: str) -> Iterator[None]:
+        """Scope converted-image state to one image pass over *html*.
+
+        The data-URI cache and pending fetches start empty, and both are
+        empty again afterwards, so a reused builder neither pins earlier
+        pages' images nor serves stale bytes or failures for files that
+        have changed since.
+        """
+        self._data_uri_cache.clear()
+        self._pending_fetches.clear()
+        try:
+            with self._prefetching_remote_images(html):
+                yield
+        finally:
+            self._data_uri_cache.clear()
+
+    @contextlib.contextmanager
+    def _prefetching_remote_images(self, html: str) -> Iterator[None]:
+        """Fetch the distinct remote image sources in *html* concurrently.
+
+        Fetches overlap on a thread pool while the caller rewrites *html*;
+        ``_to_data_uri`` then waits on the matching fetch, so errors and
+        warnings still surface in document order on the calling thread.
+        """
+        if "http" not in html:
+            yield  # no remote sources: skip the tag scan entirely
+            return
+
+        # dict.fromkeys de-duplicates while keeping document order.
+        urls = list(dict.fromkeys(
+            src
+            for src in (m.group(2) for m in _IMG_TAG_RE.finditer(html))
+            if src.startswith(("http://", "https://"))
+            and src not in self._data_uri_cache
+        ))
+        if len(urls) < 2:
+            yield
+            return
+
+        pool = ThreadPoolExecutor(max_workers=min(_MAX_FETCH_WORKERS, len(urls)))
+        try:
+            for url in urls:
+                self._pending_fetches[url] = pool.submit(self._fetch_url_as_data_uri, url)
+            yield
+        finally:
+            self._pending_fetches.clear()
+            pool.shutdown(cancel_futures=True)
 
     def _embed_images_as_data_uris(self, html: str) -> str:
         """Convert non-data-URI image sources in *html* into data URIs."""
-        return self._rewrite_image_sources(
-            html,
-            lambda src: src if src.startswith("data:") else self._to_data_uri(src),
-        )
+        if not _NON_DATA_SRC_RE.search(html):
+            return html
+        with self._page_image_scope(html):
+            return self._rewrite_image_sources(
+                html,
+                lambda src: src if src.startswith("data:") else self._to_data_uri(src),
+            )
 
     @staticmethod
     def _fetch_url_as_data_uri(url: str) -> str:
         """Fetch a remote image with SSRF, timeout, size, and MIME checks."""
         _validate_public_http_url(url)
 
-        opener = urllib.request.build_opener(_SafeRedirectHandler())
         req = urllib.request.Request(url)
-        with opener.open(req, timeout=_URL_TIMEOUT) as response:
+        with _image_opener().open(req, timeout=_URL_TIMEOUT) as response:
             _validate_public_http_url(response.geturl(), context="Final response URL")
             peer_ip = _extract_peer_ip(response)
             if peer_ip and _is_private_host(peer_ip):
@@ -256,30 +441,18 @@ class PlatformBuilder(ABC):
                         f"max {_MAX_IMAGE_BYTES})"
                     )
 
-            # Read in chunks up to the limit
-            chunks: list[bytes] = []
-            total = 0
-            while True:
-                chunk = response.read(64 * 1024)
-                if not chunk:
-                    break
-                total += len(chunk)
-                if total > _MAX_IMAGE_BYTES:
-                    raise ValueError(
-                        f"Image exceeds {_MAX_IMAGE_BYTES} byte limit"
-                    )
-                chunks.append(chunk)
-            image_data = b"".join(chunks)
-
+            # The MIME type is known from the headers: reject before reading.
             mime_type = response.headers.get_content_type()
+            if mime_type not in _ALLOWED_IMAGE_MIMES:
+                raise ValueError(
+                    f"Disallowed MIME type '{mime_type}' for image at {url}"
+                )
 
-        if mime_type not in _ALLOWED_IMAGE_MIMES:
-            raise ValueError(
-                f"Disallowed MIME type '{mime_type}' for image at {url}"
-            )
+            # Stream-encode in chunks up to the limit
+            parts = [f"data:{mime_type};base64,"]
+            parts.extend(_iter_b64(response.readinto, limit=_MAX_IMAGE_BYTES))
 
-        b64_data = base64.b64encode(image_data).decode("utf-8")
-        return f"data:{mime_type};base64,{b64_data}"
+        return "".join(parts)
 
     @staticmethod
     def _read_file_as_data_uri(src: str) -> str:
@@ -301,45 +474,49 @@ class PlatformBuilder(ABC):
             raise ValueError(
                 f"Resolved image path escapes current working directory: {src}"
             )
-        if not file_path.is_file():
-            raise ValueError(f"Image path is not a file: {src}")
 
-        with open(file_path, "rb") as f:
-            image_data = f.read(_MAX_IMAGE_BYTES + 1)
-        if len(image_data) > _MAX_IMAGE_BYTES:
-            raise ValueError(
-                f"Image file exceeds {_MAX_IMAGE_BYTES} byte limit: {src}"
-            )
+        # Check the type of what was actually opened instead of stat-ing the
+        # path first; O_NONBLOCK keeps a FIFO from blocking the open.
+        fd = os.open(file_path, _IMAGE_OPEN_FLAGS)
+        with open(fd, "rb") as f:
+            st = os.fstat(fd)
+            if not stat.S_ISREG(st.st_mode):
+                raise ValueError(f"Image path is not a file: {src}")
+            if st.st_size > _MAX_IMAGE_BYTES:
+                raise ValueError(
+                    f"Image file exceeds {_MAX_IMAGE_BYTES} byte limit: {src}"
+                )
 
-        mime_type, _ = mimetypes.guess_type(str(file_path))
-        if not mime_type:
-            mime_type = "image/png"
-        if mime_type not in _ALLOWED_IMAGE_MIMES:
-            raise ValueError(
-                f"Disallowed MIME type '{mime_type}' for file: {src}"
-            )
+            mime_type, _ = mimetypes.guess_type(str(file_path))
+            if not mime_type:
+                mime_type = "image/png"
+            if mime_type not in _ALLOWED_IMAGE_MIMES:
+                raise ValueError(
+                    f"Disallowed MIME type '{mime_type}' for file: {src}"
+                )
+
+            # The limit is enforced again while streaming in case the file grows.
+            parts = [f"data:{mime_type};base64,"]
+            parts.extend(_iter_b64(f.readinto, limit=_MAX_IMAGE_BYTES))
 
-        b64_data = base64.b64encode(image_data).decode("utf-8")
-        return f"data:{mime_type};base64,{b64_data}"
+        return "".join(parts)
 
     def _make_images_copyable(self, html: str) -> str:
         """Wrap each ``<img>`` in a container with an inline copy button."""
 
-        def wrap_image(full_tag: str, img_src: str) -> str:
+        def wrap_image(head: str, img_src: str, tail: str) -> str:
 
             if not img_src.startswith("data:"):
                 img_src = self._to_data_uri(img_src)
             if not img_src:
                 return ""
 
-            alt_match = _ALT_ATTR_RE.search(full_tag)
-            alt_text = alt_match.group(1) if alt_match else "image"
-
             return (
                 f'<div class="image-container">'
-                f'<img src="{img_src}" alt="{alt_text}">'
+                f'<img src="{img_src}" alt="{_img_alt(head, tail)}">'
                 f'<button class="copy-image-btn" type="button">Copy image</button>'
                 f'</div>'
             )
 
-        return _rewrite_img_tags(html, wrap_image)
+        with self._page_image_scope(html):
+            return _rewrite_img_tags(html, wrap_image)
@@ -6,6 +6,7 @@ embedding in HTML.
 """
 from __future__ import annotations
 
+import functools
 import io
 import inspect
 import sys
@@ -379,20 +380,23 @@ def _tokenize(
     source: str, language: str, style_cls
 ) -> list[list[tuple[tuple[int, int, int], str]]]:
     """Return per-line token lists: [ [(color_rgb, text), ...], ... ]"""
-    try:
-        lexer = get_lexer_by_name(language)
-    except Exception:
+    lexer = _lexer_by_name(language)
+    if lexer is None:
         try:
             lexer = guess_lexer(source)
         except Exception:
             lexer = TextLexer()
 
     default_color = _default_fg(style_cls)
+    colors: dict = {}  # token type -> RGB, resolved once per call
     lines: list = [[]]
 
     for ttype, value in lex(source, lexer):
-        info = style_cls.style_for_token(ttype)
-        color = _hex_to_rgb(info["color"]) if info.get("color") else default_color
+        color = colors.get(ttype)
+        if color is None:
+            info = style_cls.style_for_token(ttype)
+            color = _hex_to_rgb(info["color"]) if info.get("color") else default_color
+            colors[ttype] = color
 
         parts = value.split("\n")
         for k, part in enumerate(parts):
@@ -408,12 +412,30 @@ def _tokenize(
     return lines or [[]]
 
 
+@functools.lru_cache(maxsize=64)
+def _lexer_by_name(language: str):
+    """Return a Pygments lexer for *language*, or ``None`` if it is unknown.
+
+    Lexers hold only their options, so one instance per language is reused
+    for every cell instead of repeating the registry lookup.
+    """
+    try:
+        return get_lexer_by_name(language)
+    except Exception:
+        return None
+
+
 # ---------------------------------------------------------------------------
 # Font helpers
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=32)
 def _load_font(size: int) -> ImageFont.FreeTypeFont:
-    """Load a monospace TrueType font at the given size, falling back to Pillow's default."""
+    """Load a monospace TrueType font at the given size, falling back to Pillow's default.
+
+    Fonts are cached per size: every code, output and footer image of a
+    document reuses the same few faces instead of reopening the font file.
+    """
     path = _find_font()
     if path:
         try:
@@ -430,6 +452,7 @@ def _load_font(size: int) -> ImageFont.FreeTypeFont:
     return ImageFont.load_default()
 
 
+@functools.lru_cache(maxsize=1)
 def _find_font() -> Optional[str]:
     """Return the path to the first available monospace font for the current platform."""
     platform = sys.platform
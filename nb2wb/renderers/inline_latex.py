@@ -56,6 +56,8 @@ _GREEK = (
 
 def convert_inline_math(text: str) -> str:
     """Replace every $...$ span with its Unicode/HTML equivalent."""
+    if "$" not in text:
+        return text
     return _INLINE_RE.sub(lambda m: _to_unicode(m.group(1).strip()), text)
 
 
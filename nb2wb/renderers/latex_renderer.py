@@ -12,6 +12,7 @@ Strategy
 from __future__ import annotations
 
 import base64
+import functools
 import io
 import re
 import subprocess
@@ -19,11 +20,6 @@ import tempfile
 from pathlib import Path as _Path
 from typing import Optional
 
-import matplotlib
-import matplotlib.colors as mcolors
-
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt
 from PIL import Image, ImageChops, ImageDraw, ImageFont
 
 from ..config import LatexConfig
@@ -66,6 +62,25 @@ _FORBIDDEN_PACKAGES = frozenset(
         "verbatim",
     }
 )
+
+# Display-math delimiters, paired with a literal each pattern requires.
+_DISPLAY_MATH_PATTERNS = (
+    ("$$", re.compile(r"\$\$(.*?)\$\$", re.DOTALL), 1),
+    ("\\[", re.compile(r"\\\[(.*?)\\\]", re.DOTALL), 1),
+    # Keep the full \begin{...}...\end{...} block so the renderer can
+    # reconstruct the correct environment (not wrap it in \[...\]).
+    (
+        "\\begin{",
+        re.compile(
+            r"\\begin\{(equation|align|gather|multline|eqnarray)(\*)?\}"
+            r"(.*?)"
+            r"\\end\{\1\2?\}",
+            re.DOTALL,
+        ),
+        0,
+    ),
+)
+
 _MAX_LATEX_CHARS = 10_000
 _MAX_PREAMBLE_CHARS = 20_000
 
@@ -81,22 +96,11 @@ def extract_display_math(text: str) -> list[tuple[int, int, str]]:
     """
     raw: list[tuple[int, int, str]] = []
 
-    for m in re.finditer(r"\$\$(.*?)\$\$", text, re.DOTALL):
-        raw.append((m.start(), m.end(), m.group(1).strip()))
-
-    for m in re.finditer(r"\\\[(.*?)\\\]", text, re.DOTALL):
-        raw.append((m.start(), m.end(), m.group(1).strip()))
-
-    for m in re.finditer(
-        r"\\begin\{(equation|align|gather|multline|eqnarray)(\*)?\}"
-        r"(.*?)"
-        r"\\end\{\1\2?\}",
-        text,
-        re.DOTALL,
-    ):
-        # Keep the full \begin{...}...\end{...} block so the renderer can
-        # reconstruct the correct environment (not wrap it in \[...\]).
-        raw.append((m.start(), m.end(), m.group(0).strip()))
+    for marker, pattern, group in _DISPLAY_MATH_PATTERNS:
+        if marker not in text:
+            continue  # delimiter absent: skip this pattern's scan
+        for m in pattern.finditer(text):
+            raw.append((m.start(), m.end(), m.group(group).strip()))
 
     # Sort and remove overlaps
     raw.sort(key=lambda x: x[0])
@@ -148,6 +152,8 @@ def _draw_tag(canvas: Image.Image, tag: int, config: LatexConfig) -> None:
     # Font: Computer Modern Roman from matplotlib's bundled fonts — matches LaTeX
     font_size_px = round(config.font_size / 72.27 * config.dpi)
     font: ImageFont.ImageFont | ImageFont.FreeTypeFont
+    import matplotlib
+
     font_dir = _Path(matplotlib.__file__).parent / "mpl-data" / "fonts" / "ttf"
     try:
         font = ImageFont.truetype(str(font_dir / "cmr10.ttf"), font_size_px)
@@ -164,7 +170,7 @@ def _draw_tag(canvas: Image.Image, tag: int, config: LatexConfig) -> None:
     x = canvas.width - text_w - config.padding
     y = (canvas.height - text_h) // 2
 
-    r, g, b = (round(c * 255) for c in mcolors.to_rgb(config.color))
+    r, g, b = (round(c * 255) for c in _to_rgb(config.color))
     draw.text((x, y), text, font=font, fill=(r, g, b))
 
 
@@ -195,6 +201,27 @@ def _trim_and_pad(png_bytes: bytes, config: LatexConfig, tag: int | None = None)
 # Rendering back-ends
 # ---------------------------------------------------------------------------
 
+# matplotlib is imported on first render rather than at module import: it
+# dominates nb2wb's import time and is only needed for display math.
+
+@functools.lru_cache(maxsize=None)
+def _pyplot():
+    """Return ``matplotlib.pyplot``, selecting the non-interactive Agg backend once."""
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    return plt
+
+
+def _to_rgb(color: str) -> tuple[float, float, float]:
+    """Convert a matplotlib color spec to an RGB float triple."""
+    from matplotlib.colors import to_rgb
+
+    return to_rgb(color)
+
+
 def _render_mathtext(latex: str, config: LatexConfig, tag: int | None = None) -> str:
     """Use matplotlib's built-in mathtext (no LaTeX installation required)."""
     if latex.lstrip().startswith(r"\begin{"):
@@ -206,6 +233,7 @@ def _render_mathtext(latex: str, config: LatexConfig, tag: int | None = None) ->
     else:
         expr = f"${latex}$"
 
+    plt = _pyplot()
     fig = plt.figure(dpi=config.dpi)
     fig.patch.set_facecolor(config.background)
     ax = fig.add_axes([0, 0, 1, 1])
@@ -242,13 +270,13 @@ def _render_mathtext(latex: str, config: LatexConfig, tag: int | None = None) ->
 
 def _color_to_html(color: str) -> str:
     """Convert a matplotlib color spec to a 6-digit uppercase HTML hex (no '#')."""
-    r, g, b = mcolors.to_rgb(color)
+    r, g, b = _to_rgb(color)
     return f"{round(r * 255):02X}{round(g * 255):02X}{round(b * 255):02X}"
 
 
 def _color_to_dvipng(color: str) -> str:
     """Convert a matplotlib color spec to dvipng 'rgb R G B' format."""
-    r, g, b = mcolors.to_rgb(color)
+    r, g, b = _to_rgb(color)
     return f"rgb {r:.6f} {g:.6f} {b:.6f}"
 
 
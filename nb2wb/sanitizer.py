@@ -13,6 +13,7 @@ _CSS_DANGEROUS_RE = re.compile(
 )
 _CSS_IMPORT_RE = re.compile(r"@import\s+[^;]+;?", re.IGNORECASE)
 _CSS_URL_RE = re.compile(r"url\((.*?)\)", re.IGNORECASE | re.DOTALL)
+_SVG_ATTR_NAME_RE = re.compile(r"[a-zA-Z_:][a-zA-Z0-9_.:-]*")
 
 _VOID_TAGS = frozenset(
     {"area", "base", "br", "col", "embed", "hr", "img", "input", "meta", "param", "source"}
@@ -100,6 +101,7 @@ _SVG_ALLOWED_TAGS = frozenset(
     }
 )
 
+_PROFILES = frozenset({"html", "svg"})
 _URI_ATTRS = frozenset({"href", "src", "xlink:href"})
 _ALLOWED_DATA_IMAGE_PREFIXES = (
     "data:image/png;base64,",
@@ -118,6 +120,11 @@ def sanitize_fragment(
     profile: str = "html",
 ) -> str:
     """Sanitize an HTML/SVG fragment using a parser-based allowlist."""
+    if "<" not in fragment and "&" not in fragment:
+        # Without markup or references the parser emits the text verbatim.
+        if profile not in _PROFILES:
+            raise ValueError(f"Unknown sanitizer profile: {profile}")
+        return fragment
     parser = _FragmentSanitizer(profile=profile)
     parser.feed(fragment)
     parser.close()
@@ -129,7 +136,7 @@ class _FragmentSanitizer(HTMLParser):
 
     def __init__(self, *, profile: str) -> None:
         super().__init__(convert_charrefs=False)
-        if profile not in {"html", "svg"}:
+        if profile not in _PROFILES:
             raise ValueError(f"Unknown sanitizer profile: {profile}")
         self._profile = profile
         self._parts: list[str] = []
@@ -269,7 +276,7 @@ def _is_allowed_svg_attr(name: str) -> bool:
     if name.startswith("data-") or name.startswith("aria-"):
         return True
     # Keep SVG quality high by allowing standard non-event attribute names.
-    return bool(re.fullmatch(r"[a-zA-Z_:][a-zA-Z0-9_.:-]*", name))
+    return _SVG_ATTR_NAME_RE.fullmatch(name) is not None
 
 
 def _sanitize_uri(value: str, *, attr_name: str, tag: str) -> str | None:
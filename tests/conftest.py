@@ -355,7 +355,13 @@ def mock_font_available(monkeypatch):
         """Mock ImageFont.truetype to return mock font."""
         return MockFont(size)
 
+    from nb2wb.renderers.code_renderer import _load_font
+
+    # Loaded fonts are cached per size; keep mock fonts out of other tests.
+    _load_font.cache_clear()
     monkeypatch.setattr(ImageFont, "truetype", mock_truetype)
+    yield
+    _load_font.cache_clear()
 
 
 # ==============================================================================
@@ -4,9 +4,13 @@ Integration tests for markdown cell processing in the converter.
 Tests the complete pipeline: markdown → LaTeX processing → HTML conversion.
 """
 import base64
+import math
 import re
 
 import nbformat
+import pytest
+
+from nb2wb import converter as converter_mod
 from nb2wb.converter import Converter
 
 
@@ -219,6 +223,25 @@ class TestMarkdownCellProcessing:
         # Table should be converted to HTML
         assert "<table>" in html or "<th>" in html
 
+    def test_markdown_state_does_not_leak_between_cells(self, minimal_config, tmp_path):
+        """Footnotes and abbreviations from one cell do not affect the next."""
+        nb = nbformat.v4.new_notebook()
+        nb.cells = [
+            nbformat.v4.new_markdown_cell("Text[^1]\n\n[^1]: note\n\n*[HTML]: Hyper"),
+            nbformat.v4.new_markdown_cell("Plain HTML paragraph"),
+        ]
+
+        notebook_path = tmp_path / "test.ipynb"
+        with open(notebook_path, "w") as f:
+            nbformat.write(nb, f)
+
+        html = Converter(minimal_config).convert(notebook_path)
+        second = html.split('<div class="md-cell">')[2]
+
+        assert html.count('class="footnote"') == 1
+        assert "<abbr" not in second
+        assert "Plain HTML paragraph" in second
+
     def test_empty_markdown_cell(self, minimal_config, tmp_path):
         """Empty markdown cells handled gracefully."""
         nb = nbformat.v4.new_notebook()
@@ -300,6 +323,33 @@ class TestEquationReferences:
         assert html.count("data:image/png;base64,") == 3
 
 
+    def test_label_scan_reuses_limit_pass_extraction(
+        self, minimal_config, tmp_path, monkeypatch
+    ):
+        """Display math is extracted once for limits+labels and once for rendering."""
+        nb = nbformat.v4.new_notebook()
+        nb.cells = [
+            nbformat.v4.new_markdown_cell("$$x = 1 \\label{eq:a}$$\n\nSee \\eqref{eq:a}."),
+        ]
+
+        calls = []
+        real = converter_mod.extract_display_math
+
+        def counting(text):
+            calls.append(text)
+            return real(text)
+
+        monkeypatch.setattr(converter_mod, "extract_display_math", counting)
+        monkeypatch.setattr(
+            converter_mod, "render_latex_block", lambda *a, **k: "data:image/png;base64,AA=="
+        )
+
+        html = Converter(minimal_config).convert_notebook(nb)
+
+        assert len(calls) == 2
+        assert "(1)" in html
+
+
 class TestEdgeCases:
     """Test edge cases in markdown processing."""
 
@@ -336,6 +386,173 @@ class TestEdgeCases:
         # HTML should be preserved or escaped safely
         assert "Bold" in html
 
+    def test_ipynb_reader_matches_nbformat_with_and_without_orjson(
+        self, tmp_path, monkeypatch
+    ):
+        """The optional orjson reader yields the same notebook as nbformat.read."""
+        pytest.importorskip("orjson")
+        nb = nbformat.v4.new_notebook()
+        nb.cells = [
+            nbformat.v4.new_markdown_cell("# Title\n\nBody"),
+            nbformat.v4.new_code_cell("print(1)"),
+        ]
+        notebook_path = tmp_path / "test.ipynb"
+        with open(notebook_path, "w") as f:
+            nbformat.write(nb, f)
+
+        fast = converter_mod._read_ipynb(notebook_path)
+        monkeypatch.setattr(converter_mod, "_orjson", None)
+        slow = converter_mod._read_ipynb(notebook_path)
+
+        assert fast == slow == nbformat.read(str(notebook_path), as_version=4)
+
+    def test_ipynb_reader_accepts_nan_written_by_nbformat(self, tmp_path):
+        """NaN/Infinity outputs that nbformat writes read back with orjson installed."""
+        nb = nbformat.v4.new_notebook()
+        cell = nbformat.v4.new_code_cell("x")
+        cell.outputs = [
+            nbformat.v4.new_output(
+                "execute_result",
+                data={"application/json": {"value": float("nan"), "top": float("inf")}},
+                execution_count=1,
+            )
+        ]
+        nb.cells = [cell]
+        notebook_path = tmp_path / "nan.ipynb"
+        with open(notebook_path, "w") as f:
+            nbformat.write(nb, f)
+        assert "NaN" in notebook_path.read_text(encoding="utf-8")
+
+        read = converter_mod._read_ipynb(notebook_path)
+
+        payload = read.cells[0].outputs[0].data["application/json"]
+        assert math.isnan(payload["value"])
+        assert payload["top"] == float("inf")
+
+    def test_ipynb_reader_rejects_non_json(self, tmp_path):
+        """Non-JSON .ipynb input raises a ValueError on either parser."""
+        notebook_path = tmp_path / "broken.ipynb"
+        notebook_path.write_text("not json", encoding="utf-8")
+
+        with pytest.raises(ValueError):
+            converter_mod._read_ipynb(notebook_path)
+
+
+class TestParallelRendering:
+    """Test rendering cells on a process pool."""
+
+    def test_parallel_output_matches_sequential(self, minimal_config, tmp_path):
+        """jobs > 1 produces the same HTML, in document order."""
+        nb = nbformat.v4.new_notebook()
+        nb.cells = [
+            nbformat.v4.new_markdown_cell("# First"),
+            nbformat.v4.new_code_cell("x = 1\nprint(x)"),
+            nbformat.v4.new_markdown_cell("Second with `code`"),
+            nbformat.v4.new_markdown_cell("hidden", metadata={"tags": ["hide-cell"]}),
+            nbformat.v4.new_markdown_cell("Third"),
+        ]
+
+        notebook_path = tmp_path / "test.ipynb"
+        with open(notebook_path, "w") as f:
+            nbformat.write(nb, f)
+
+        sequential = Converter(minimal_config).convert(notebook_path)
+        minimal_config.jobs = 2
+        parallel = Converter(minimal_config).convert(notebook_path)
+
+        assert parallel == sequential
+        assert parallel.index("First") < parallel.index("Second") < parallel.index("Third")
+        assert "hidden" not in parallel
+
+    def test_worker_count_is_capped_by_cpu_count(self, minimal_config, monkeypatch):
+        """A huge jobs value never starts more processes than there are CPUs."""
+        import concurrent.futures
+
+        seen: list[int] = []
+
+        class FakePool:
+            def __init__(self, max_workers, initializer, initargs):
+                seen.append(max_workers)
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def map(self, fn, jobs):
+                return [("<p>cell</p>", []) for _ in jobs]
+
+        monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", FakePool)
+        monkeypatch.setattr(converter_mod.os, "cpu_count", lambda: 4)
+        minimal_config.jobs = 10_000
+        converter = Converter(minimal_config)
+        converter._lang = "python"
+        converter._latex_preamble = ""
+        converter._eq_labels = {}
+        cells = [(nbformat.v4.new_markdown_cell(str(i)), frozenset()) for i in range(50)]
+
+        assert converter._render_cells_in_pool(cells) == ["<p>cell</p>"] * 50
+        assert seen == [4]
+
+        seen.clear()
+        converter._render_cells_in_pool(cells[:3])
+        assert seen == [3]
+
+
+class TestRenderCaching:
+    """Identical inputs within a document are rendered once."""
+
+    def test_repeated_code_and_outputs_render_once(self, minimal_config, monkeypatch):
+        """Repeated sources and stream outputs reuse the first rendered PNG."""
+        calls = {"code": 0, "text": 0}
+        real_code = converter_mod.render_code
+        real_text = converter_mod.render_output_text
+
+        def counting_code(*args, **kwargs):
+            calls["code"] += 1
+            return real_code(*args, **kwargs)
+
+        def counting_text(*args, **kwargs):
+            calls["text"] += 1
+            return real_text(*args, **kwargs)
+
+        monkeypatch.setattr(converter_mod, "render_code", counting_code)
+        monkeypatch.setattr(converter_mod, "render_output_text", counting_text)
+
+        stream = nbformat.v4.new_output("stream", name="stdout", text="hello\n")
+        nb = nbformat.v4.new_notebook()
+        nb.cells = [
+            nbformat.v4.new_code_cell("print('hello')", outputs=[stream]),
+            nbformat.v4.new_code_cell("print('hello')", outputs=[stream]),
+        ]
+
+        html = Converter(minimal_config).convert_notebook(nb)
+
+        assert calls == {"code": 1, "text": 1}
+        first, second = html.split('<div class="code-cell">')[1:]
+        assert first.strip() == second.strip()
+
+    def test_repeated_equations_render_once(self, minimal_config, monkeypatch):
+        """The same display-math block with the same tag is rendered once."""
+        rendered = []
+
+        def fake_render(latex, config, preamble, tag=None):
+            rendered.append((latex, tag))
+            return "data:image/png;base64,AA=="
+
+        monkeypatch.setattr(converter_mod, "render_latex_block", fake_render)
+
+        nb = nbformat.v4.new_notebook()
+        nb.cells = [
+            nbformat.v4.new_markdown_cell("$$a+b$$"),
+            nbformat.v4.new_markdown_cell("$$a+b$$\n\n$$a+b \\label{eq:x}$$"),
+        ]
+
+        Converter(minimal_config).convert_notebook(nb)
+
+        assert rendered == [("a+b", None), ("a+b", 1)]
+
 
 class TestSecuritySanitization:
     """Test sanitization of notebook-provided HTML/SVG fragments."""
@@ -203,6 +203,20 @@ class TestMarkdownExecutionFlag:
         Converter(minimal_config, execute=True).convert(md)
         assert called is True
 
+    def test_execute_skips_kernel_without_code(self, minimal_config, tmp_path, monkeypatch):
+        """With execute=True, documents without runnable code never start a kernel."""
+        import nbconvert.preprocessors
+
+        qmd = tmp_path / "prose.qmd"
+        qmd.write_text("# Prose\n\nOnly text.\n\n```{python}\n\n```\n")
+
+        def fail_preprocessor(*args, **kwargs):
+            raise AssertionError("kernel should not be started")
+
+        monkeypatch.setattr(nbconvert.preprocessors, "ExecutePreprocessor", fail_preprocessor)
+        html = Converter(minimal_config, execute=True).convert(qmd)
+        assert "Only text." in html
+
     def test_qmd_execute_false_skips_execution(self, minimal_config, tmp_path, monkeypatch):
         """With execute=False, .qmd files are parsed but not executed."""
         qmd = tmp_path / "test.qmd"
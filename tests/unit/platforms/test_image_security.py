@@ -8,6 +8,8 @@ from __future__ import annotations
 
 import base64
 import http.server
+import os
+import socket
 import threading
 import urllib.request
 from pathlib import Path
@@ -15,10 +17,15 @@ from unittest.mock import patch
 
 import pytest
 
+from nb2wb.platforms import base as base_mod
 from nb2wb.platforms.base import (
     PlatformBuilder,
     _SafeRedirectHandler,
+    _b64encode,
+    _image_opener,
     _is_private_host,
+    _resolve_host_cached,
+    _iter_b64,
     _MAX_IMAGE_BYTES,
 )
 from nb2wb.platforms.substack import SubstackBuilder
@@ -82,6 +89,37 @@ class TestIsPrivateHost:
         with patch("socket.getaddrinfo", side_effect=OSError("dns failure")):
             assert _is_private_host("unresolvable.example.test") is True
 
+    def test_successful_lookups_are_cached(self):
+        _resolve_host_cached.cache_clear()
+        infos = [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("93.184.216.34", 0))]
+        with patch("socket.getaddrinfo", return_value=infos) as lookup:
+            assert _is_private_host("cdn.example.test") is False
+            assert _is_private_host("cdn.example.test") is False
+        _resolve_host_cached.cache_clear()
+        assert lookup.call_count == 1
+
+    def test_cached_lookups_expire(self, monkeypatch):
+        _resolve_host_cached.cache_clear()
+        public = [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("93.184.216.34", 0))]
+        private = [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("10.0.0.1", 0))]
+        now = [1000.0]
+        monkeypatch.setattr(base_mod.time, "monotonic", lambda: now[0])
+        with patch("socket.getaddrinfo", return_value=public):
+            assert _is_private_host("rebind.example.test") is False
+        now[0] += base_mod._DNS_CACHE_TTL
+        with patch("socket.getaddrinfo", return_value=private):
+            assert _is_private_host("rebind.example.test") is True
+        _resolve_host_cached.cache_clear()
+
+    def test_failed_lookups_are_not_cached(self):
+        _resolve_host_cached.cache_clear()
+        infos = [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("93.184.216.34", 0))]
+        with patch("socket.getaddrinfo", side_effect=OSError("dns failure")):
+            assert _is_private_host("flaky.example.test") is True
+        with patch("socket.getaddrinfo", return_value=infos):
+            assert _is_private_host("flaky.example.test") is False
+        _resolve_host_cached.cache_clear()
+
 
 # ---------------------------------------------------------------------------
 # Path traversal
@@ -136,6 +174,22 @@ class TestPathTraversal:
         with pytest.raises(ValueError, match="escapes current working directory"):
             PlatformBuilder._read_file_as_data_uri("link.png")
 
+    def test_rejects_directory(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "figs.png").mkdir()
+
+        with pytest.raises((ValueError, OSError)):
+            PlatformBuilder._read_file_as_data_uri("figs.png")
+
+    def test_rejects_fifo_without_blocking(self, tmp_path, monkeypatch):
+        if not hasattr(os, "mkfifo"):
+            pytest.skip("FIFOs not supported in this environment")
+        monkeypatch.chdir(tmp_path)
+        os.mkfifo(tmp_path / "pipe.png")
+
+        with pytest.raises(ValueError, match="not a file"):
+            PlatformBuilder._read_file_as_data_uri("pipe.png")
+
 
 # ---------------------------------------------------------------------------
 # SSRF
@@ -189,6 +243,14 @@ class TestSSRF:
                 newurl="http://127.0.0.1/admin",
             )
 
+    def test_shared_opener_uses_safe_redirects(self):
+        opener = _image_opener()
+        assert opener is _image_opener()
+        assert any(isinstance(h, _SafeRedirectHandler) for h in opener.handlers)
+        assert not any(
+            type(h) is urllib.request.HTTPRedirectHandler for h in opener.handlers
+        )
+
 
 # ---------------------------------------------------------------------------
 # MIME type validation
@@ -249,6 +311,36 @@ class TestSizeLimit:
         with pytest.raises(ValueError, match="byte limit"):
             PlatformBuilder._read_file_as_data_uri("huge.png")
 
+    def test_streamed_encoding_matches_one_shot_with_short_reads(self):
+        data = bytes(range(256)) * 1000 + b"tail"
+        offsets = iter([7, 1, 2, 65536, 100, 3, 5])
+        pos = 0
+
+        def readinto(buf):
+            nonlocal pos
+            step = min(len(buf), next(offsets, len(buf)))
+            chunk = data[pos:pos + step]
+            buf[:len(chunk)] = chunk
+            pos += len(chunk)
+            return len(chunk)
+
+        assert "".join(_iter_b64(readinto, limit=len(data))) == base64.b64encode(data).decode()
+
+    def test_encoder_accepts_buffer_slices(self):
+        data = memoryview(bytearray(bytes(range(256)) * 3))
+        assert _b64encode(data[1:301]) == base64.b64encode(bytes(data[1:301]))
+
+    def test_streamed_encoding_enforces_limit(self):
+        chunks = iter([b"abc", b"def", b""])
+
+        def readinto(buf):
+            chunk = next(chunks)
+            buf[:len(chunk)] = chunk
+            return len(chunk)
+
+        with pytest.raises(ValueError, match="byte limit"):
+            list(_iter_b64(readinto, limit=5))
+
 
 # ---------------------------------------------------------------------------
 # Integration: _to_data_uri fallback behaviour
@@ -281,6 +373,87 @@ class TestToDataUriFallback:
         result = builder._to_data_uri("evil.html")
         assert result == ""
 
+    def test_repeated_source_is_converted_once(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "logo.png").write_bytes(_TINY_PNG)
+        calls: list[str] = []
+        real = PlatformBuilder._read_file_as_data_uri
+
+        def counting(src):
+            calls.append(src)
+            return real(src)
+
+        monkeypatch.setattr(PlatformBuilder, "_read_file_as_data_uri", staticmethod(counting))
+        builder = SubstackBuilder()
+        out = builder._embed_images_as_data_uris('<img src="logo.png"><img src="logo.png">')
+
+        assert calls == ["logo.png"]
+        assert out.count("data:image/png;base64,") == 2
+
+    def test_reused_builder_starts_each_page_with_an_empty_cache(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        logo = tmp_path / "logo.png"
+        logo.write_bytes(_TINY_PNG)
+        builder = SubstackBuilder()
+
+        first = builder.build_page('<img src="logo.png">')
+        assert builder._data_uri_cache == {}
+
+        logo.write_bytes(_TINY_PNG + b"changed")
+        second = builder.build_page('<img src="logo.png">')
+
+        assert _TINY_PNG_B64 in first
+        assert base64.b64encode(_TINY_PNG + b"changed").decode() in second
+        assert builder._data_uri_cache == {}
+
+
+class TestRemoteImagePrefetch:
+    """Distinct remote images on a page are fetched concurrently."""
+
+    def test_remote_images_are_fetched_concurrently(self, monkeypatch):
+        barrier = threading.Barrier(2, timeout=5)
+        calls: list[str] = []
+
+        def fetch(url):
+            calls.append(url)
+            barrier.wait()  # both fetches must be in flight at once
+            return f"data:image/png;base64,{_TINY_PNG_B64}"
+
+        monkeypatch.setattr(PlatformBuilder, "_fetch_url_as_data_uri", staticmethod(fetch))
+        html = (
+            '<img src="https://a.example/1.png">'
+            '<img src="https://b.example/2.png">'
+            '<img src="https://a.example/1.png">'
+        )
+        out = SubstackBuilder()._embed_images_as_data_uris(html)
+
+        assert sorted(calls) == ["https://a.example/1.png", "https://b.example/2.png"]
+        assert out.count("data:image/png;base64,") == 3
+
+    def test_pages_without_remote_sources_skip_the_scan(self, monkeypatch):
+        class NoScan:
+            def finditer(self, html):
+                raise AssertionError("prefetch scan should be skipped")
+
+        monkeypatch.setattr(base_mod, "_IMG_TAG_RE", NoScan())
+        html = f'<img src="data:image/png;base64,{_TINY_PNG_B64}" alt="a">'
+        with MediumBuilder()._prefetching_remote_images(html):
+            pass
+
+    def test_prefetch_failures_warn_and_drop_the_image(self, monkeypatch):
+        def fetch(url):
+            if "bad" in url:
+                raise ValueError("boom")
+            return f"data:image/png;base64,{_TINY_PNG_B64}"
+
+        monkeypatch.setattr(PlatformBuilder, "_fetch_url_as_data_uri", staticmethod(fetch))
+        html = '<img src="https://a.example/ok.png"><img src="https://a.example/bad.png">'
+
+        with pytest.warns(RuntimeWarning, match="bad.png"):
+            out = MediumBuilder()._make_images_copyable(html)
+
+        assert out.count("copy-image-btn") == 1
+
 
 class TestStrictImageMode:
     """Strict image mode should fail closed for unsafe sources."""
@@ -299,6 +472,59 @@ class TestStrictImageMode:
         assert "data:image/png;base64" in out
 
 
+class TestImgTagMatching:
+    """Image rewriting should target each tag's real ``src`` attribute."""
+
+    def test_data_src_after_src_is_not_the_source(self):
+        builder = MediumBuilder()
+        html = (
+            f'<img src="data:image/png;base64,{_TINY_PNG_B64}" '
+            'data-src="../../../etc/passwd" alt="ok">'
+        )
+        out = builder._make_images_copyable(html)
+        assert f'<img src="data:image/png;base64,{_TINY_PNG_B64}" alt="ok">' in out
+
+    def test_multiline_and_self_closing_tags(self):
+        builder = SubstackBuilder()
+        html = '<img\n  alt="a"\n  src="data:image/png;base64,AAAA" />'
+        assert builder._embed_images_as_data_uris(html) == html
+
+    def test_data_only_pages_skip_the_rewrite(self, monkeypatch):
+        def fail(*args, **kwargs):
+            raise AssertionError("rewrite should be skipped")
+
+        monkeypatch.setattr(PlatformBuilder, "_rewrite_image_sources", staticmethod(fail))
+        html = '<p><img SRC="data:image/png;base64,AAAA" alt="a"></p>'
+        assert SubstackBuilder()._embed_images_as_data_uris(html) is html
+
+    def test_uppercase_data_scheme_is_still_converted(self):
+        html = '<img src="DATA:text/html;base64,AAAA">'
+        with pytest.warns(RuntimeWarning):
+            assert SubstackBuilder()._embed_images_as_data_uris(html) == ""
+
+    def test_only_the_real_src_is_rewritten(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "logo.png").write_bytes(_TINY_PNG)
+        builder = SubstackBuilder()
+        html = '<img data-src="logo.png" src="logo.png" alt="a">'
+        out = builder._embed_images_as_data_uris(html)
+        assert out == (
+            f'<img data-src="logo.png" src="data:image/png;base64,{_TINY_PNG_B64}" alt="a">'
+        )
+
+    def test_alt_is_read_on_either_side_of_src(self):
+        builder = MediumBuilder()
+        src = f"data:image/png;base64,{_TINY_PNG_B64}"
+        before = builder._make_images_copyable(f'<img alt="first" src="{src}">')
+        after = builder._make_images_copyable(f'<img src="{src}" alt="second">')
+        missing = builder._make_images_copyable(f'<img src="{src}">')
+        unterminated = builder._make_images_copyable(f'<img src="{src}" alt="x>')
+        assert 'alt="first"' in before
+        assert 'alt="second"' in after
+        assert 'alt="image"' in missing
+        assert 'alt="image"' in unterminated
+
+
 # ---------------------------------------------------------------------------
 # CLI _extract_images MIME filtering
 # ---------------------------------------------------------------------------
@@ -323,6 +549,15 @@ class TestExtractImagesMime:
         if images_dir.exists():
             assert len(list(images_dir.iterdir())) == 0
 
+    def test_no_inline_images_leaves_html_and_disk_untouched(self, tmp_path):
+        from nb2wb.cli import _extract_images
+
+        html = '<p>text</p><img src="https://example.com/a.png" alt="a">'
+        result = _extract_images(html, tmp_path / "images")
+
+        assert result == html
+        assert not (tmp_path / "images").exists()
+
     def test_extracts_valid_png(self, tmp_path):
         from nb2wb.cli import _extract_images
 
@@ -341,3 +576,21 @@ class TestExtractImagesMime:
 
         assert f"data:image/png;base64,{bad_b64}" in result
         assert len(list((tmp_path / "images").iterdir())) == 0
+
+    def test_rewrites_multiple_images_in_order(self, tmp_path):
+        from nb2wb.cli import _extract_images
+
+        html = (
+            f'<p><img class="a" src="data:image/png;base64,{_TINY_PNG_B64}" alt="one"></p>'
+            f'<img src="data:text/html;base64,{_TINY_PNG_B64}">'
+            f'<img src="data:image/png;base64,{_TINY_PNG_B64}" alt="two" />'
+        )
+        result = _extract_images(html, tmp_path / "images")
+
+        assert '<p><img class="a" src="images/img_1.png" alt="one"></p>' in result
+        assert '<img src="images/img_2.png" alt="two" />' in result
+        assert f"data:text/html;base64,{_TINY_PNG_B64}" in result
+        assert sorted(p.name for p in (tmp_path / "images").iterdir()) == [
+            "img_1.png",
+            "img_2.png",
+        ]
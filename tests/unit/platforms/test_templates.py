@@ -0,0 +1,67 @@
+"""
+Unit tests for the shared preview page template (nb2wb.platforms._templates).
+"""
+from __future__ import annotations
+
+import pytest
+
+from nb2wb.platforms import _templates
+from nb2wb.platforms._templates import build_page
+
+
+def _page(content: str, **kwargs) -> str:
+    kwargs.setdefault("title", "Preview")
+    kwargs.setdefault("toolbar_message", "Paste it.")
+    kwargs.setdefault("script", "console.log(1);")
+    return build_page(content, **kwargs)
+
+
+class TestBuildPage:
+    """Test page assembly around converted content."""
+
+    def test_content_sits_inside_content_div(self):
+        html = _page("<p>body</p>")
+        assert '<div id="content">\n<p>body</p>\n  <div class="nb2wb-footer">' in html
+        assert "<title>Preview</title>" in html
+        assert "<p>Paste it.</p>" in html
+        assert "console.log(1);" in html
+
+    def test_content_placeholders_are_not_substituted(self):
+        html = _page("<p>$title ${script} $$</p>")
+        assert "<p>$title ${script} $$</p>" in html
+
+    def test_theme_overrides_replace_base_values(self):
+        html = _page("", theme_overrides={"body-color": "#123456", "extra-var": "1px"})
+        assert "--body-color: #123456;" in html
+        assert "--body-color: #222;" not in html
+        assert "--extra-var: 1px;" in html
+
+    def test_page_shell_is_rendered_once_per_arguments(self):
+        _templates._page_shell.cache_clear()
+        first = _page("<p>a</p>", theme_overrides={"body-color": "#000"})
+        second = _page("<p>b</p>", theme_overrides={"body-color": "#000"})
+        info = _templates._page_shell.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+        assert first.replace("<p>a</p>", "<p>b</p>") == second
+
+    def test_unhashable_overrides_render_without_caching(self):
+        _templates._page_shell.cache_clear()
+        html = _page("", theme_overrides={"body-color": ["#123456"]})
+        assert "--body-color: ['#123456'];" in html
+        assert _templates._page_shell.cache_info().currsize == 0
+
+    def test_type_errors_while_rendering_propagate(self, monkeypatch):
+        real = _templates._theme_vars
+        calls = []
+
+        def fails_once(theme):
+            calls.append(theme)
+            if len(calls) == 1:
+                raise TypeError("bad theme value")
+            return real(theme)
+
+        monkeypatch.setattr(_templates, "_theme_vars", fails_once)
+        _templates._page_shell.cache_clear()
+        with pytest.raises(TypeError, match="bad theme value"):
+            _page("", theme_overrides={"body-color": "#000"})
+        _templates._page_shell.cache_clear()
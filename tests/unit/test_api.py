@@ -75,6 +75,56 @@ class TestPublicApi:
 
         assert "NotebookNode Input" in html
 
+    def test_convert_does_not_mutate_notebook_payload(self):
+        notebook_dict = {
+            "cells": [{"cell_type": "markdown", "metadata": {}, "source": "# Hi"}],
+            "metadata": {"kernelspec": {"name": "python3", "language": "python"}},
+            "nbformat": 4,
+            "nbformat_minor": 5,
+        }
+
+        nb2wb.convert(notebook_dict, config={"latex": {"try_usetex": False}})
+
+        assert "id" not in notebook_dict["cells"][0]
+        assert "display_name" not in notebook_dict["metadata"]["kernelspec"]
+
+    def test_coerce_assigns_unique_ids_to_cells_without_one(self):
+        payload = {
+            "cells": [
+                {"cell_type": "markdown", "metadata": {}, "source": str(i)}
+                for i in range(50)
+            ],
+            "metadata": {},
+            "nbformat": 4,
+            "nbformat_minor": 5,
+        }
+        payload["cells"][3]["id"] = "keep-me"
+
+        node = api._coerce_notebook_node(payload)
+
+        ids = [cell["id"] for cell in node.cells]
+        assert ids[3] == "keep-me"
+        assert len(set(ids)) == 50
+        assert all(len(cid) == 8 for i, cid in enumerate(ids) if i != 3)
+
+    def test_convert_can_skip_payload_validation(self, monkeypatch):
+        nb = nbformat.v4.new_notebook()
+        nb.cells = [nbformat.v4.new_markdown_cell("# Trusted")]
+
+        def reject(node, *args, **kwargs):
+            raise nbformat.ValidationError("schema walk should be skipped")
+
+        monkeypatch.setattr(api.nbformat, "validate", reject)
+
+        html = nb2wb.convert(nb, config={"latex": {"try_usetex": False}}, validate=False)
+        assert "Trusted" in html
+
+        try:
+            nb2wb.convert(nb, config={"latex": {"try_usetex": False}})
+            raise AssertionError("Expected ValueError when validation is enabled")
+        except ValueError as exc:
+            assert "Invalid Jupyter notebook payload" in str(exc)
+
     def test_convert_rejects_invalid_notebook_payload(self):
         invalid_payload = {
             "cells": [],
@@ -88,6 +138,37 @@ class TestPublicApi:
         except ValueError as exc:
             assert "Invalid Jupyter notebook payload" in str(exc)
 
+    def test_resolve_working_dir_validates_directory(self, tmp_path):
+        assert api._resolve_working_dir(tmp_path) == tmp_path.resolve()
+
+        not_a_dir = tmp_path / "file.txt"
+        not_a_dir.write_text("x")
+        try:
+            api._resolve_working_dir(not_a_dir)
+            raise AssertionError("Expected ValueError for a non-directory working_dir")
+        except ValueError as exc:
+            assert "must be a directory" in str(exc)
+
+        try:
+            api._resolve_working_dir(tmp_path / "missing")
+            raise AssertionError("Expected FileNotFoundError for a missing working_dir")
+        except FileNotFoundError as exc:
+            assert "not found" in str(exc)
+
+    def test_rejects_control_characters_in_paths(self, tmp_path):
+        for bad in ("note\x00.md", "note\n.md", "note\x7f.md"):
+            try:
+                api._sanitize_input_path(tmp_path / bad)
+                raise AssertionError("Expected ValueError for control characters")
+            except ValueError as exc:
+                assert "control characters" in str(exc)
+
+        try:
+            api._resolve_working_dir(f"{tmp_path}\x1b")
+            raise AssertionError("Expected ValueError for control characters")
+        except ValueError as exc:
+            assert "control characters" in str(exc)
+
     def test_convert_rejects_bad_extension(self, tmp_path):
         txt = tmp_path / "note.txt"
         txt.write_text("hello")
@@ -109,8 +190,9 @@ class TestPublicApi:
                 seen["execute"] = execute
                 seen["config_type"] = type(config).__name__
 
-            def convert(self, notebook_path):
+            def convert(self, notebook_path, *, validate=True):
                 seen["notebook"] = str(notebook_path)
+                seen["validate"] = validate
                 return "<div>fragment</div>"
 
         class DummyBuilder:
@@ -125,6 +207,46 @@ class TestPublicApi:
         html = api.convert(md, execute=True)
 
         assert seen["execute"] is True
+        assert seen["validate"] is True
         assert seen["config_type"] == "Config"
         assert str(md) == seen["notebook"]
         assert "<html>" in html
+
+    def test_default_config_is_built_once_per_target(self, tmp_path, monkeypatch):
+        md = tmp_path / "article.md"
+        md.write_text("# Defaults")
+
+        seen: list[object] = []
+
+        class DummyConverter:
+            def __init__(self, config, *, execute):
+                seen.append(config)
+
+            def convert(self, notebook_path, *, validate=True):
+                return "<div>fragment</div>"
+
+        monkeypatch.setattr(api, "Converter", DummyConverter)
+
+        api.convert(md, target="medium")
+        api.convert(md, target="medium")
+        api.convert(md, target="x")
+
+        assert seen[0] is seen[1]
+        assert seen[0] is not seen[2]
+        assert seen[0] == api.apply_platform_defaults(api.Config(), "medium")
+        assert seen[2] == api.apply_platform_defaults(api.Config(), "x")
+
+    def test_convert_can_skip_file_validation(self, tmp_path, monkeypatch):
+        nb = nbformat.v4.new_notebook()
+        nb.cells = [nbformat.v4.new_markdown_cell("# Trusted")]
+        path = tmp_path / "trusted.ipynb"
+        path.write_text(nbformat.writes(nb), encoding="utf-8")
+
+        def fail_validate(*args, **kwargs):
+            raise AssertionError("validate should not run")
+
+        monkeypatch.setattr(nbformat, "validate", fail_validate)
+
+        html = api.convert(path, validate=False)
+
+        assert "Trusted" in html
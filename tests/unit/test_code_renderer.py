@@ -420,6 +420,11 @@ class TestFontLoading:
         font = _load_font(12)
         assert font is not None
 
+    def test_load_font_reuses_font_per_size(self, mock_font_available):
+        """Fonts are loaded once per size and then reused."""
+        assert _load_font(30) is _load_font(30)
+        assert _load_font(30) is not _load_font(31)
+
     def test_find_font_returns_path_or_none(self):
         """_find_font returns path or None."""
         result = _find_font()
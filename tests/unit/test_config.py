@@ -4,6 +4,8 @@ Unit tests for configuration loading and merging.
 Tests the config.py module which handles YAML loading, defaults,
 inheritance, and platform-specific adjustments.
 """
+import pickle
+
 import pytest
 from pathlib import Path
 from nb2wb.config import (
@@ -31,6 +33,15 @@ class TestConfigDefaults:
         assert config.safety.max_display_math_blocks == 500
         assert config.safety.max_total_latex_chars == 1_000_000
 
+    def test_config_classes_are_plain_dataclasses(self):
+        """Config objects keep a __dict__ on every Python version and pickle cleanly."""
+        config = Config(jobs=2)
+        for obj in (config, config.code, config.latex, config.safety):
+            assert isinstance(vars(obj), dict)
+        config.note = "ad-hoc"
+        assert config.note == "ad-hoc"
+        assert pickle.loads(pickle.dumps(Config(jobs=2))) == Config(jobs=2)
+
     def test_code_config_defaults(self):
         """Default CodeConfig has expected values."""
         code = CodeConfig()
@@ -126,18 +137,62 @@ safety:
                 "code": {"font_size": 30},
                 "latex": {"dpi": 200},
                 "safety": {"max_cells": 123},
+                "jobs": 3,
             }
         )
         assert config.image_width == 1200
+        assert config.jobs == 3
         assert config.code.font_size == 30
         assert config.latex.dpi == 200
         assert config.safety.max_cells == 123
 
+    def test_jobs_string_is_coerced(self, tmp_path):
+        """A quoted YAML ``jobs`` value is read as an integer."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text('jobs: "2"\n')
+        assert load_config(config_path).jobs == 2
+
+    @pytest.mark.parametrize("jobs", [4, "4", 4.0])
+    def test_jobs_integral_values_are_accepted(self, jobs):
+        """Ints, integer strings and integral floats give the same jobs count."""
+        assert load_config_from_dict({"jobs": jobs}).jobs == 4
+
+    @pytest.mark.parametrize(
+        "jobs", [0, -3, "0", "many", None, True, False, 2.9, "2.5", float("inf")]
+    )
+    def test_jobs_below_one_is_rejected(self, jobs):
+        """``jobs`` must be a positive integer, as with the CLI's --jobs."""
+        with pytest.raises(ValueError, match="expected a positive integer"):
+            load_config_from_dict({"jobs": jobs})
+
     def test_load_config_from_dict_rejects_non_mapping(self):
         """Non-dict config input raises a TypeError."""
         with pytest.raises(TypeError):
             load_config_from_dict(["not", "a", "mapping"])
 
+    def test_load_config_returns_fresh_instances(self, tmp_path):
+        """Cached YAML parsing never hands out a shared Config object."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("code:\n  font_size: 36\n")
+        first = load_config(config_path)
+        first.code.font_size = 10
+        second = load_config(config_path)
+        assert second is not first
+        assert second.code.font_size == 36
+
+    def test_load_config_picks_up_file_changes(self, tmp_path):
+        """Editing the config file invalidates the parse cache."""
+        import os
+
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("image_width: 1000\n")
+        assert load_config(config_path).image_width == 1000
+
+        config_path.write_text("image_width: 12345\n")
+        st = config_path.stat()
+        os.utime(config_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert load_config(config_path).image_width == 12345
+
 
 class TestConfigInheritance:
     """Test configuration inheritance from top-level to sub-configs."""
@@ -285,6 +340,11 @@ class TestPlatformDefaults:
         # But sub-configs get new CodeConfig/LatexConfig instances with platform defaults
         # which don't inherit the custom border_radius
 
+    def test_platform_defaults_preserve_jobs(self):
+        """Platform defaults keep the configured worker count."""
+        result = apply_platform_defaults(Config(jobs=4), "medium")
+        assert result.jobs == 4
+
     def test_unknown_platform_unchanged(self):
         """Unknown platform returns config unchanged."""
         config = Config()
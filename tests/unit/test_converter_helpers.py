@@ -0,0 +1,211 @@
+"""Unit tests for converter helper functions (nb2wb.converter)."""
+from __future__ import annotations
+
+import re
+
+import nbformat
+import pytest
+
+from nb2wb import converter as converter_mod
+from nb2wb.config import Config
+from nb2wb.converter import (
+    Converter,
+    _INLINE_CODE_RE,
+    _apply_eq_tag,
+    _collect_doc_metadata,
+    _find_fenced_code_spans,
+    _join_text,
+    _protect_markdown_code_spans,
+    _restore_protected_spans,
+    _strip_ansi,
+)
+
+# Reference patterns the hand-written scanners must agree with.
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*[mGKFHJ]")
+_FENCED_CODE_RE = re.compile(r"^(`{3,})[^\n]*\n.*?\1[ \t]*$", re.MULTILINE | re.DOTALL)
+
+
+class TestStripAnsi:
+    """_strip_ansi removes ESC [ ... final sequences only."""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "",
+            "plain traceback",
+            "\x1b[0;31mValueError\x1b[0m: boom",
+            "\x1b[1;32m---\x1b[39m\n\x1b[2K\x1b[H",
+            "\x1b[31",  # truncated sequence is kept
+            "\x1b[31x keep",  # unknown final char is kept
+            "\x1b[\x1b[31mred",
+            "lone \x1b escape",
+        ],
+    )
+    def test_matches_reference_regex(self, text):
+        assert _strip_ansi(text) == _ANSI_RE.sub("", text)
+
+    def test_returns_input_unchanged_without_escapes(self):
+        text = "Traceback (most recent call last):"
+        assert _strip_ansi(text) is text
+
+
+class TestProtectedSpans:
+    """Code spans survive the protect/restore round trip."""
+
+    def test_round_trip_restores_all_spans(self):
+        src = "a `x` b\n```\n$y$\n```\nc ``z`` d"
+        protected, stash = _protect_markdown_code_spans(src)
+        assert "`" not in protected
+        assert _restore_protected_spans(protected, stash) == src
+
+    @pytest.mark.parametrize(
+        "src",
+        [
+            "`a` then\n```\n`not inline`\n```\nand `b`",
+            "``x`` ```\n```py\ny\n```",
+            "no code at all $x$",
+        ],
+    )
+    def test_matches_sequential_fenced_then_inline_passes(self, src):
+        """Same spans as a fenced-regex pass followed by an inline-regex pass."""
+        expected: list[str] = []
+
+        def _stash(m):
+            expected.append(m.group(0))
+            return "\x00"
+
+        reference = _INLINE_CODE_RE.sub(_stash, _FENCED_CODE_RE.sub(_stash, src))
+        protected, stash = _protect_markdown_code_spans(src)
+
+        assert sorted(stash) == sorted(expected)
+        assert re.sub(r"\x00PROTECTED\d+\x00", "\x00", protected) == reference
+        assert _restore_protected_spans(protected, stash) == src
+
+    def test_empty_stash_returns_input_unchanged(self):
+        text = "no spans \x00PROTECTED0\x00"
+        assert _restore_protected_spans(text, []) is text
+
+    def test_unknown_placeholders_are_left_alone(self):
+        text = "keep \x00PROTECTED7\x00 and \x00PROTECTED01\x00"
+        assert _restore_protected_spans(text, ["only"]) == text
+
+
+class TestFindFencedCodeSpans:
+    """_find_fenced_code_spans matches the fenced-code regex it replaced."""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "",
+            "no fences here",
+            "```python\nx = $a$\n```",
+            "```\ncode\n```  \nafter\n```\nmore\n```",
+            "````\ninner ```\n````\n",  # longer fence needs a matching closer
+            "`````\nonly ``` closes\n",  # fence shortens to the longest closer
+            "```\nunterminated",
+            "```",  # opening line needs a newline
+            "text ```\n```\nx ```\t\n",
+            "```\r\nwindows\r\n```\r\n",
+            "a\n```js\n\n```\n\n```\nb\n```",
+        ],
+    )
+    def test_matches_reference_regex(self, text):
+        expected = [m.span() for m in _FENCED_CODE_RE.finditer(text)]
+        assert _find_fenced_code_spans(text) == expected
+
+    def test_many_consecutive_fences(self):
+        text = "```\n" * 20_000
+        assert _find_fenced_code_spans(text) == [
+            m.span() for m in _FENCED_CODE_RE.finditer(text)
+        ]
+
+
+class TestJoinText:
+    """_join_text accepts str, list[str] and tolerates malformed payloads."""
+
+    def test_joins_string_lists(self):
+        assert _join_text(["a", "b"], sep="\n") == "a\nb"
+
+    def test_skips_non_string_parts(self):
+        assert _join_text(["a", 1, None, "b"]) == "ab"
+
+    def test_other_types_become_empty(self):
+        assert _join_text(None) == ""
+        assert _join_text({"text": "x"}) == ""
+
+
+class TestApplyEqTag:
+    """_apply_eq_tag strips labels and resolves tag numbers."""
+
+    def test_unlabelled_block_is_only_stripped(self):
+        assert _apply_eq_tag("  x^2  ", {"eq:a": 1}) == ("x^2", None)
+
+    def test_label_is_removed_and_numbered(self):
+        assert _apply_eq_tag(r"x^2 \label{eq:a}", {"eq:a": 3}) == ("x^2", 3)
+
+    def test_escaped_label_is_kept(self):
+        latex = r"\text{\\label{eq:a}}"
+        assert _apply_eq_tag(latex, {"eq:a": 1}) == (latex, None)
+
+
+class TestCollectDocMetadata:
+    """_collect_doc_metadata gathers preamble and labels in one pass."""
+
+    def test_preamble_and_labels_in_source_order(self):
+        preamble = nbformat.v4.new_markdown_cell(
+            "  \\newcommand{\\R}{\\mathbb{R}}  \n$$x \\label{eq:pre}$$"
+        )
+        preamble.metadata["tags"] = ["latex-preamble"]
+        hidden = nbformat.v4.new_markdown_cell("$$y \\label{eq:hidden}$$")
+        hidden.metadata["tags"] = ["hide-cell"]
+        cells = [
+            nbformat.v4.new_markdown_cell("$$a \\label{eq:a}$$"),
+            preamble,
+            hidden,
+            nbformat.v4.new_code_cell("# $$b \\label{eq:code}$$"),
+            nbformat.v4.new_markdown_cell("$$b \\label{eq:b}$$\n$$c \\label{eq:a}$$"),
+        ]
+
+        text, labels = _collect_doc_metadata(cells)
+
+        assert text == "\\newcommand{\\R}{\\mathbb{R}}  \n$$x \\label{eq:pre}$$"
+        assert labels == {"eq:a": 1, "eq:b": 2}
+
+
+class TestSanitizeFragmentCache:
+    """Converter._sanitize_fragment memoizes small fragments per document."""
+
+    def test_repeated_small_fragment_is_sanitized_once(self, monkeypatch):
+        calls = []
+        real = converter_mod.sanitize_fragment
+
+        def counting(fragment, *, profile):
+            calls.append(profile)
+            return real(fragment, profile=profile)
+
+        monkeypatch.setattr(converter_mod, "sanitize_fragment", counting)
+        converter = Converter(Config())
+        fragment = "<table><tr><td onclick='x()'>1</td></tr></table>"
+
+        first = converter._sanitize_fragment(fragment, profile="html")
+        second = converter._sanitize_fragment(fragment, profile="html")
+
+        assert first == second
+        assert "onclick" not in first
+        assert calls == ["html"]
+
+    def test_cache_is_per_document(self):
+        converter = Converter(Config())
+        converter._sanitize_fragment("<b>x</b>", profile="html")
+        assert converter._sanitize_cache
+
+        converter._reset_render_caches()
+        assert not converter._sanitize_cache
+        assert not Converter(Config())._sanitize_cache
+
+    def test_large_fragments_bypass_the_cache(self):
+        converter = Converter(Config())
+        fragment = "<p>" + "x" * converter_mod._SANITIZE_CACHE_MAX_CHARS + "</p>"
+
+        assert converter._sanitize_fragment(fragment, profile="html") == fragment
+        assert not converter._sanitize_cache
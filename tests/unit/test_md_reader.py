@@ -5,10 +5,19 @@ Tests parsing of plain .md files into nbformat NotebookNode objects,
 including code block extraction, language detection, latex-preamble blocks,
 nb2wb HTML comment directives, front matter, and edge cases.
 """
+import re
+
 import pytest
 from pathlib import Path
 
 from nb2wb.md_reader import read_md, _split_front_matter, _detect_language, _extract_cells, _consume_directives
+from nb2wb.md_reader import _find_code_blocks
+
+# The fenced-block regex _find_code_blocks replaced, kept as a reference.
+_MD_CODE_RE = re.compile(
+    r"^(`{3,}|~{3,})(\S*)([ \t][^\n]*)?\n(.*?)^\1[ \t]*$",
+    re.DOTALL | re.MULTILINE,
+)
 
 
 # ==============================================================================
@@ -478,3 +487,35 @@ class TestConsumeDirectives:
         result = _consume_directives("plain text", tags)
         assert tags == []
         assert result == "plain text"
+
+
+class TestFindCodeBlocks:
+    """Test the _find_code_blocks scanner against the reference regex."""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "",
+            "prose only",
+            "```python hide-input\nx = 1\n```",
+            "~~~\na\n~~~  \nmid\n```r\nb\n```\n",
+            "````\n```\n````\n",  # shorter fence inside a longer one
+            "`````py\nx\n```\n",  # fence shortens; surplus backticks lead lang
+            "```\nunclosed\n~~~\n",
+            "```py\r\nx\r\n```\r\n",  # \r after the word: not a fence line
+            "```\n```",  # closer without trailing newline
+            "text ```\n```\n```\n",
+            "```a\u00a0b\n```\n",
+        ],
+    )
+    def test_matches_reference_regex(self, text):
+        expected = [
+            (m.start(), m.end(), m.group(2), m.group(3) or "", m.group(4))
+            for m in _MD_CODE_RE.finditer(text)
+        ]
+        assert _find_code_blocks(text) == expected
+
+    def test_many_unmatched_long_fences(self):
+        """Unclosable long fences are rejected without rescanning the body."""
+        text = "````\n" + "````y\n" * 3000
+        assert _find_code_blocks(text) == []
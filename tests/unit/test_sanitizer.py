@@ -48,3 +48,16 @@ class TestSanitizeFragmentSvg:
         out = sanitize_fragment(svg, profile="svg").lower()
         assert "onload=" not in out
         assert "<rect" in out
+
+
+class TestSanitizeFragmentPlainText:
+    def test_text_without_markup_is_returned_verbatim(self):
+        text = "x > 1 and y = 'a' \"quoted\""
+        assert sanitize_fragment(text, profile="html") is text
+
+    def test_unknown_profile_is_rejected_on_fast_path(self):
+        try:
+            sanitize_fragment("plain", profile="xml")
+            raise AssertionError("Expected ValueError for unknown profile")
+        except ValueError as exc:
+            assert "Unknown sanitizer profile" in str(exc)
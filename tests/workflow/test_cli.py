@@ -441,6 +441,55 @@ class TestCLIServerSafeMode:
         assert seen["has_safety_limits"] is True
 
 
+class TestCLIJobs:
+    """Test the --jobs option."""
+
+    def test_cli_jobs_overrides_config(self, tmp_path, monkeypatch):
+        """--jobs is applied on top of the loaded config file."""
+        md_path = tmp_path / "doc.md"
+        md_path.write_text("# Jobs")
+        cfg = tmp_path / "config.yaml"
+        cfg.write_text("image_width: 900\njobs: 2\n")
+
+        seen: dict[str, object] = {}
+
+        def fake_convert(notebook, *, config, target, execute):
+            seen["config"] = config
+            return "<html><body><p>ok</p></body></html>"
+
+        monkeypatch.setattr("nb2wb.cli.convert_notebook", fake_convert)
+        sys.argv = ["nb2wb", str(md_path), "-c", str(cfg), "-j", "3", "-o", str(tmp_path / "o.html")]
+        main()
+
+        assert seen["config"].jobs == 3
+        assert seen["config"].image_width == 900
+
+    def test_cli_jobs_with_bad_config_reports_failure(self, tmp_path, capsys):
+        """A bad config file fails cleanly whether or not --jobs is given."""
+        md_path = tmp_path / "doc.md"
+        md_path.write_text("# Jobs")
+        cfg = tmp_path / "bad.yaml"
+        cfg.write_text("- not\n- a mapping\n")
+        sys.argv = ["nb2wb", str(md_path), "-c", str(cfg), "-j", "2"]
+
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+
+        assert exc_info.value.code == 1
+        assert "Conversion failed:" in capsys.readouterr().err
+
+    def test_cli_rejects_non_positive_jobs(self, tmp_path, capsys):
+        """--jobs must be at least 1."""
+        md_path = tmp_path / "doc.md"
+        md_path.write_text("# Jobs")
+        sys.argv = ["nb2wb", str(md_path), "--jobs", "0"]
+
+        with pytest.raises(SystemExit):
+            main()
+
+        assert "positive integer" in capsys.readouterr().err
+
+
 class TestCLIInputSanitization:
     """Test CLI sanitization and validation of user-provided paths."""
 
@@ -530,3 +579,81 @@ class TestCLIOutputValidation:
         # Images should be base64 encoded
         if "img" in html.lower():
             assert "data:image" in html or "base64" in html
+
+
+class TestCLIServeHandler:
+    """Test the static-file handler used by --serve."""
+
+    def test_sendfile_handler_serves_file_bytes(self, tmp_path):
+        """Files are served byte-for-byte through the sendfile-based handler."""
+        import functools
+        import threading
+        import urllib.request
+        from http.server import HTTPServer
+
+        from nb2wb.cli import _sendfile_request_handler
+
+        payload = bytes(range(256)) * 1024
+        (tmp_path / "img_1.png").write_bytes(payload)
+
+        handler = functools.partial(_sendfile_request_handler(), directory=str(tmp_path))
+        server = HTTPServer(("127.0.0.1", 0), handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            port = server.server_address[1]
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/img_1.png", timeout=5) as resp:
+                body = resp.read()
+                content_type = resp.headers["Content-Type"]
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert body == payload
+        assert content_type == "image/png"
+
+
+class TestCLINgrokPolling:
+    """Test polling of ngrok's local tunnel API."""
+
+    def test_returns_without_sleeping_when_tunnel_is_ready(self, monkeypatch):
+        """A ready tunnel is returned on the first poll with no delay."""
+        import io
+        import json
+        import time
+        import urllib.request
+
+        from nb2wb.cli import _get_ngrok_url
+
+        sleeps = []
+        monkeypatch.setattr(time, "sleep", sleeps.append)
+        body = json.dumps(
+            {"tunnels": [{"proto": "https", "public_url": "https://abc.ngrok.app"}]}
+        ).encode()
+        monkeypatch.setattr(
+            urllib.request, "urlopen", lambda *a, **k: io.BytesIO(body)
+        )
+
+        assert _get_ngrok_url() == "https://abc.ngrok.app"
+        assert sleeps == []
+
+    def test_backs_off_exponentially_until_giving_up(self, monkeypatch):
+        """Failed polls back off from 50 ms, capped at 1 s."""
+        import time
+        import urllib.error
+        import urllib.request
+
+        from nb2wb.cli import _get_ngrok_url
+
+        sleeps = []
+        monkeypatch.setattr(time, "sleep", sleeps.append)
+
+        def refuse(*args, **kwargs):
+            raise urllib.error.URLError("connection refused")
+
+        monkeypatch.setattr(urllib.request, "urlopen", refuse)
+
+        with pytest.raises(RuntimeError, match="ngrok"):
+            _get_ngrok_url(max_attempts=8)
+
+        assert sleeps == pytest.approx([0.05, 0.1, 0.2, 0.4, 0.8, 1.0, 1.0])